@@ -5,6 +5,9 @@ config.py — Центральный конфиг приложения YouTube D
 
 import os
 
+# Домашняя папка пользователя (вычисляется один раз)
+_HOME = os.path.expanduser("~")
+
 # ===== Приложение =====
 APP_NAME = "YouTube Downloader"
 ORG_NAME = "YTDownloader"
@@ -12,11 +15,12 @@ APP_FONT = "Segoe UI"
 APP_FONT_SIZE = 10
 
 # ===== Настройки по умолчанию =====
-DEFAULT_OUTPUT_DIR = os.path.join(os.path.expanduser("~"), "Downloads")
+DEFAULT_OUTPUT_DIR = os.path.join(_HOME, "Downloads")
 DEFAULT_FORMAT = "1080p"
 DEFAULT_SMART_PASTE = False
 DEFAULT_MAX_CONCURRENT = 3
 DEFAULT_LOG_TO_FILE = True
+DEFAULT_USE_NATIVE_DIALOG = True
 
 # ===== Логирование =====
 LOG_FILENAME = "youtube_downloader.log"
@@ -25,7 +29,8 @@ LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 LOG_LOGGER_NAME = "YTDownloader"
 
+# ===== Кэш превью =====
+THUMB_CACHE_DIR = os.path.join(_HOME, ".cache", "ytdl", "thumbs")
+
 # ===== Путь к файлу настроек =====
-SETTINGS_FILE = os.path.join(
-    os.path.expanduser("~"), ".youtube_downloader_settings.json"
-)
+SETTINGS_FILE = os.path.join(_HOME, ".youtube_downloader_settings.json")
@@ -5,18 +5,24 @@ converter.py — Проверка FFmpeg и конвертация медиа.
 import shutil
 import subprocess
 import os
-import sys
+from functools import lru_cache
+
+
+# Директория приложения (вычисляется один раз при импорте)
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 def _get_app_dir() -> str:
     """Возвращает директорию приложения."""
-    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return _APP_DIR
 
 
+@lru_cache(maxsize=1)
 def get_ffmpeg_path() -> str:
     """
     Ищет ffmpeg: сначала рядом с приложением, потом в PATH.
     Возвращает путь или пустую строку.
+    Результат кэшируется на всю сессию (см. clear_ffmpeg_cache).
     """
     # 1. Рядом с приложением
     local = os.path.join(_get_app_dir(), "ffmpeg.exe" if os.name == "nt" else "ffmpeg")
@@ -28,11 +34,13 @@ def get_ffmpeg_path() -> str:
     return path if path else ""
 
 
+@lru_cache(maxsize=1)
 def check_ffmpeg() -> bool:
     """Проверяет, доступен ли FFmpeg."""
     return bool(get_ffmpeg_path())
 
 
+@lru_cache(maxsize=1)
 def get_ffprobe_path() -> str:
     """Ищет ffprobe рядом с приложением или в PATH."""
     local = os.path.join(_get_app_dir(), "ffprobe.exe" if os.name == "nt" else "ffprobe")
@@ -40,3 +48,36 @@ def get_ffprobe_path() -> str:
         return local
     path = shutil.which("ffprobe")
     return path if path else ""
+
+
+def clear_ffmpeg_cache():
+    """Сбросить кэш поиска FFmpeg (например, после установки FFmpeg или смены настроек)."""
+    for func in (get_ffmpeg_path, check_ffmpeg, get_ffprobe_path):
+        func.cache_clear()
+
+
+# Буфер пайпа для ffmpeg: 1 МБ вместо небуферизованного чтения по кусочкам
+FFMPEG_PIPE_BUFSIZE = 1 << 20
+
+
+def run_ffmpeg(args: list[str], **kwargs) -> subprocess.CompletedProcess:
+    """
+    Запускает ffmpeg с аргументами args и ждёт завершения.
+    Все прямые вызовы ffmpeg в приложении должны идти через эту функцию:
+    stdin/stderr отключены, stdout читается через большой буфер,
+    на Windows не открывается консольное окно.
+    Параметры можно переопределить через kwargs.
+    """
+    ffmpeg = get_ffmpeg_path()
+    if not ffmpeg:
+        raise FileNotFoundError("FFmpeg не найден")
+
+    options = {
+        "bufsize": FFMPEG_PIPE_BUFSIZE,
+        "stdin": subprocess.DEVNULL,
+        "stdout": subprocess.PIPE,
+        "stderr": subprocess.DEVNULL,
+        "creationflags": subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+    }
+    options.update(kwargs)
+    return subprocess.run([ffmpeg, *args], **options)
@@ -1,77 +1,138 @@
 """
 downloader.py — Менеджер загрузок YouTube-видео через yt-dlp.
-Работает в отдельных QThread, чтобы не блокировать UI.
+Загрузки выполняются в общем QThreadPool с ограничением числа одновременных.
 """
 
 import os
-import re
-import traceback
+import time
+import logging
+from collections import namedtuple
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 
 import yt_dlp
 
-from core.converter import check_ffmpeg, get_ffmpeg_path
+from core.config import DEFAULT_MAX_CONCURRENT
+from core.converter import get_ffmpeg_path
 from core.logger import log
 
+# Один тик прогресса загрузки (передаётся в UI сигналом progress)
+ProgressTick = namedtuple("ProgressTick", "percent speed eta downloaded total")
+
+# Минимальный интервал между сигналами прогресса (~10 Гц)
+_PROGRESS_EMIT_INTERVAL = 0.1
+
+# Единицы измерения: (суффикс, делитель, формат). Индекс = (bit_length - 1) // 10
+_BYTE_UNITS = (
+    (" B", 1.0, "{:.0f}"),
+    (" KB", 1024.0, "{:.1f}"),
+    (" MB", 1048576.0, "{:.1f}"),
+    (" GB", 1073741824.0, "{:.2f}"),
+)
+_SPEED_UNITS = (
+    (" B/s", 1.0, "{:.0f}"),
+    (" KB/s", 1024.0, "{:.1f}"),
+    (" MB/s", 1048576.0, "{:.1f}"),
+)
+
+
+def _build_format(height: int, has_ffmpeg: bool) -> str:
+    """Строка выбора формата yt-dlp для заданной высоты."""
+    if has_ffmpeg:
+        # С FFmpeg: скачиваем лучшее видео + лучшее аудио отдельно, затем склеиваем
+        return (
+            f"bestvideo[height<={height}][ext=mp4]+bestaudio[ext=m4a]/"
+            f"bestvideo[height<={height}]+bestaudio/"
+            f"best[height<={height}]/"
+            f"best"
+        )
+    # Без FFmpeg: берём только комбинированные форматы (видео+аудио в одном файле)
+    return (
+        f"best[height<={height}][ext=mp4]/"
+        f"best[height<={height}]/"
+        f"best[ext=mp4]/"
+        f"best"
+    )
+
+
+# Заранее собранные строки форматов для стандартных разрешений
+_HEIGHTS = (2160, 1440, 1080, 720, 480, 360)
+_FORMAT_TABLE = {
+    (h, ffmpeg): _build_format(h, ffmpeg)
+    for h in _HEIGHTS
+    for ffmpeg in (True, False)
+}
+
+
+class DownloadSignals(QObject):
+    """Сигналы DownloadWorker (QRunnable сам не может их объявлять)."""
+    progress = pyqtSignal(object)  # ProgressTick
+    finished = pyqtSignal(str, object)  # путь, размер в байтах (или None)
+    error = pyqtSignal(str)
+    status_update = pyqtSignal(str)
+    merging = pyqtSignal()
+    done = pyqtSignal()  # run() завершился (успех, ошибка или отмена)
+
 
-class DownloadWorker(QThread):
+class DownloadWorker(QRunnable):
     """
-    Рабочий поток для скачивания одного видео.
+    Задача скачивания одного видео для QThreadPool.
     Сигналы для обновления UI.
     """
 
-    # Сигналы
-    progress = pyqtSignal(dict)
-    finished = pyqtSignal(str)
-    error = pyqtSignal(str)
-    status_update = pyqtSignal(str)
-    merging = pyqtSignal()
-
     def __init__(self, url: str, format_choice: dict, output_dir: str, parent=None):
-        super().__init__(parent)
+        super().__init__()
+        # Жизнью задачи управляет Python (ссылка хранится в MainWindow.active_workers)
+        self.setAutoDelete(False)
+        self.signals = DownloadSignals(parent)
+        self.progress = self.signals.progress
+        self.finished = self.signals.finished
+        self.error = self.signals.error
+        self.status_update = self.signals.status_update
+        self.merging = self.signals.merging
+
         self.url = url
         self.format_choice = format_choice
         self.output_dir = output_dir
         self._cancelled = False
+        self._last_emit = 0.0
 
     def cancel(self):
         """Отменить загрузку."""
         self._cancelled = True
-        log.info(f"Загрузка отменена: {self.url}")
+        log.info("Загрузка отменена: %s", self.url)
 
     def run(self):
-        """Основной метод потока."""
-        log.info(f"Начало загрузки: {self.url} | формат: {self.format_choice}")
+        """Основной метод задачи (выполняется в потоке пула)."""
+        try:
+            if not self._cancelled:
+                self._run_download()
+        finally:
+            self.signals.done.emit()
+
+    def _run_download(self):
+        log.info("Начало загрузки: %s | формат: %s", self.url, self.format_choice)
         try:
             if self.format_choice["type"] == "audio":
                 self._download_audio()
             else:
                 self._download_video()
         except Exception as e:
-            log.error(f"Ошибка загрузки: {e}\n{traceback.format_exc()}")
+            log.error("Ошибка загрузки: %s", e, exc_info=True)
             if not self._cancelled:
                 self.error.emit(str(e))
 
     @staticmethod
     def _format_bytes(b: float) -> str:
-        if b < 1024:
-            return f"{b:.0f} B"
-        elif b < 1024 ** 2:
-            return f"{b / 1024:.1f} KB"
-        elif b < 1024 ** 3:
-            return f"{b / (1024 ** 2):.1f} MB"
-        else:
-            return f"{b / (1024 ** 3):.2f} GB"
+        idx = min(max((int(b).bit_length() - 1) // 10, 0), len(_BYTE_UNITS) - 1)
+        unit, div, fmt = _BYTE_UNITS[idx]
+        return fmt.format(b / div) + unit
 
     @staticmethod
     def _format_speed(s: float) -> str:
-        if s < 1024:
-            return f"{s:.0f} B/s"
-        elif s < 1024 ** 2:
-            return f"{s / 1024:.1f} KB/s"
-        else:
-            return f"{s / (1024 ** 2):.1f} MB/s"
+        idx = min(max((int(s).bit_length() - 1) // 10, 0), len(_SPEED_UNITS) - 1)
+        unit, div, fmt = _SPEED_UNITS[idx]
+        return fmt.format(s / div) + unit
 
     @staticmethod
     def _format_eta(seconds: int) -> str:
@@ -99,21 +160,21 @@ class DownloadWorker(QThread):
             else:
                 percent = 0.0
 
+            # Не чаще ~10 раз в секунду — UI всё равно не успевает отрисовать больше
+            now = time.monotonic()
+            if now - self._last_emit < _PROGRESS_EMIT_INTERVAL and percent < 100:
+                return
+            self._last_emit = now
+
             speed_str = self._format_speed(speed) if speed else "..."
             eta_str = self._format_eta(eta) if eta is not None else "..."
             downloaded_str = self._format_bytes(downloaded)
             total_str = self._format_bytes(total) if total > 0 else "?"
 
-            self.progress.emit({
-                "percent": percent,
-                "speed": speed_str,
-                "eta": eta_str,
-                "downloaded": downloaded_str,
-                "total": total_str,
-            })
+            self.progress.emit(ProgressTick(percent, speed_str, eta_str, downloaded_str, total_str))
 
         elif d["status"] == "finished":
-            self.progress.emit({"percent": 100.0, "speed": "", "eta": "", "downloaded": "", "total": ""})
+            self.progress.emit(ProgressTick(100.0, "", "", "", ""))
             self.status_update.emit("Обработка...")
 
     def _download_video(self):
@@ -121,26 +182,17 @@ class DownloadWorker(QThread):
         self.status_update.emit("Подготовка загрузки...")
 
         height = self.format_choice.get("height", 1080)
-        has_ffmpeg = check_ffmpeg()
+        ffmpeg_path = get_ffmpeg_path()
+        has_ffmpeg = bool(ffmpeg_path)
 
-        log.info(f"FFmpeg доступен: {has_ffmpeg} | Запрошенное качество: {height}p")
+        log.info("FFmpeg доступен: %s | Запрошенное качество: %sp", has_ffmpeg, height)
 
-        if has_ffmpeg:
-            # С FFmpeg: скачиваем лучшее видео + лучшее аудио отдельно, затем склеиваем
-            format_str = (
-                f"bestvideo[height<={height}][ext=mp4]+bestaudio[ext=m4a]/"
-                f"bestvideo[height<={height}]+bestaudio/"
-                f"best[height<={height}]/"
-                f"best"
-            )
-        else:
-            # Без FFmpeg: берём только комбинированные форматы (видео+аудио в одном файле)
-            format_str = (
-                f"best[height<={height}][ext=mp4]/"
-                f"best[height<={height}]/"
-                f"best[ext=mp4]/"
-                f"best"
-            )
+        format_str = _FORMAT_TABLE.get((height, has_ffmpeg)) or _build_format(height, has_ffmpeg)
+        format_id = self.format_choice.get("format_id")
+        if has_ffmpeg and format_id:
+            # Формат уже найден при парсинге — берём его напрямую, цепочка по высоте остаётся запасной
+            format_str = f"{format_id}+bestaudio[ext=m4a]/{format_id}+bestaudio/{format_str}"
+        if not has_ffmpeg:
             log.warning("FFmpeg не найден — используется комбинированный формат (макс ~720p)")
 
         ydl_opts = {
@@ -152,7 +204,6 @@ class DownloadWorker(QThread):
         }
 
         # Указываем путь к FFmpeg
-        ffmpeg_path = get_ffmpeg_path()
         if ffmpeg_path:
             ydl_opts["ffmpeg_location"] = os.path.dirname(ffmpeg_path)
 
@@ -162,57 +213,68 @@ class DownloadWorker(QThread):
             ydl_opts["postprocessors"] = [{
                 "key": "FFmpegVideoConvertor",
                 "preferedformat": "mp4",
+                "when": "post_process",
             }]
+            # Все ядра для ffmpeg и moov-атом в начале файла
+            ydl_opts["postprocessor_args"] = {
+                "ffmpeg": ["-threads", "0", "-movflags", "+faststart"],
+            }
 
-        log.info(f"yt-dlp format string: {format_str}")
+        log.info("yt-dlp format string: %s", format_str)
         self.status_update.emit("Скачивание видео...")
 
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             info = ydl.extract_info(self.url, download=True)
             filepath = ydl.prepare_filename(info)
 
-            # Логируем фактическое качество
-            actual_w = info.get("width", "?")
-            actual_h = info.get("height", "?")
-            actual_format = info.get("format", "?")
-            actual_vcodec = info.get("vcodec", "?")
-            actual_acodec = info.get("acodec", "?")
-            req_formats = info.get("requested_formats", [])
-            if req_formats:
-                parts = []
-                for rf in req_formats:
-                    rw = rf.get("width", "?")
-                    rh = rf.get("height", "?")
-                    rc = rf.get("vcodec", rf.get("acodec", "?"))
-                    parts.append(f"{rw}x{rh} ({rc})")
-                log.info(f"DASH потоки: {' + '.join(parts)}")
-            log.info(f"Итоговое качество: {actual_w}x{actual_h} | format={actual_format} | vcodec={actual_vcodec} | acodec={actual_acodec}")
-
-            # yt-dlp может поменять расширение после мержа
-            if not os.path.exists(filepath):
+            # Логируем фактическое качество (строки собираем, только если INFO включён)
+            if log.isEnabledFor(logging.INFO):
+                req_formats = info.get("requested_formats", [])
+                if req_formats:
+                    parts = []
+                    for rf in req_formats:
+                        rw = rf.get("width", "?")
+                        rh = rf.get("height", "?")
+                        rc = rf.get("vcodec", rf.get("acodec", "?"))
+                        parts.append(f"{rw}x{rh} ({rc})")
+                    log.info("DASH потоки: %s", " + ".join(parts))
+                log.info(
+                    "Итоговое качество: %sx%s | format=%s | vcodec=%s | acodec=%s",
+                    info.get("width", "?"), info.get("height", "?"), info.get("format", "?"),
+                    info.get("vcodec", "?"), info.get("acodec", "?"),
+                )
+
+            # yt-dlp может поменять расширение после мержа — один stat на кандидата
+            try:
+                fsize = os.stat(filepath).st_size
+            except OSError:
+                fsize = None
                 base = os.path.splitext(filepath)[0]
                 for ext in (".mp4", ".mkv", ".webm"):
                     candidate = base + ext
-                    if os.path.exists(candidate):
-                        filepath = candidate
-                        break
+                    try:
+                        fsize = os.stat(candidate).st_size
+                    except OSError:
+                        continue
+                    filepath = candidate
+                    break
 
         if not self._cancelled:
             # Логируем размер файла
-            try:
-                fsize = os.path.getsize(filepath)
-                log.info(f"Загрузка завершена: {filepath} | размер: {fsize / (1024*1024):.1f} MB")
-            except OSError:
-                log.info(f"Загрузка завершена: {filepath}")
+            if fsize is not None:
+                log.info("Загрузка завершена: %s | размер: %.1f MB", filepath, fsize / (1024 * 1024))
+            else:
+                log.info("Загрузка завершена: %s", filepath)
             self.status_update.emit("Готово!")
-            self.finished.emit(filepath)
+            self.finished.emit(filepath, fsize)
 
     def _download_audio(self):
         """Скачивание аудио. С FFmpeg — конвертация в MP3, без — скачивание как есть."""
         self.status_update.emit("Подготовка загрузки аудио...")
 
-        has_ffmpeg = check_ffmpeg()
-        log.info(f"Загрузка аудио | FFmpeg доступен: {has_ffmpeg}")
+        ffmpeg_path = get_ffmpeg_path()
+        has_ffmpeg = bool(ffmpeg_path)
+        log.info("Загрузка аудио | FFmpeg доступен: %s", has_ffmpeg)
 
         ydl_opts = {
             "format": "bestaudio/best",
@@ -223,7 +285,6 @@ class DownloadWorker(QThread):
         }
 
         # Указываем путь к FFmpeg
-        ffmpeg_path = get_ffmpeg_path()
         if ffmpeg_path:
             ydl_opts["ffmpeg_location"] = os.path.dirname(ffmpeg_path)
 
@@ -234,6 +295,7 @@ class DownloadWorker(QThread):
                 "preferredcodec": "mp3",
                 "preferredquality": "192",
             }]
+            ydl_opts["postprocessor_args"] = {"ffmpeg": ["-threads", "0"]}
         else:
             # Без FFmpeg — скачиваем аудио как есть (webm/m4a)
             log.warning("FFmpeg не найден — аудио будет скачано без конвертации в MP3")
@@ -244,14 +306,69 @@ class DownloadWorker(QThread):
             info = ydl.extract_info(self.url, download=True)
             filepath = ydl.prepare_filename(info)
 
+            fsize = None
             if has_ffmpeg:
                 # После конвертации расширение будет .mp3
                 base = os.path.splitext(filepath)[0]
                 mp3_path = base + ".mp3"
-                if os.path.exists(mp3_path):
+                try:
+                    fsize = os.stat(mp3_path).st_size
                     filepath = mp3_path
+                except OSError:
+                    pass
+            if fsize is None:
+                try:
+                    fsize = os.stat(filepath).st_size
+                except OSError:
+                    pass
 
         if not self._cancelled:
-            log.info(f"Загрузка аудио завершена: {filepath}")
+            log.info("Загрузка аудио завершена: %s", filepath)
             self.status_update.emit("Готово!")
-            self.finished.emit(filepath)
+            self.finished.emit(filepath, fsize)
+
+
+class DownloadManager:
+    """
+    Очередь загрузок: не больше max_concurrent задач выполняются одновременно,
+    остальные ждут в очереди пула.
+    """
+
+    def __init__(self, max_concurrent: int = DEFAULT_MAX_CONCURRENT):
+        self.pool = QThreadPool()
+        self.set_max_concurrent(max_concurrent)
+        # Держим ссылки на задачи, пока пул их не отработал
+        self._workers: set[DownloadWorker] = set()
+
+    def set_max_concurrent(self, max_concurrent: int):
+        """Изменить лимит одновременных загрузок."""
+        self.pool.setMaxThreadCount(max(1, max_concurrent))
+
+    def start(self, worker: DownloadWorker):
+        """Поставить загрузку в очередь."""
+        self._workers.add(worker)
+        # Прямое соединение: ссылка снимается в потоке пула, без очереди событий GUI
+        # (иначе отложенный вызов может прийти уже после удаления worker'а)
+        worker.signals.done.connect(
+            lambda w=worker: self._workers.discard(w), Qt.ConnectionType.DirectConnection
+        )
+        self.pool.start(worker)
+
+    def cancel(self, worker: DownloadWorker):
+        """Отменить загрузку; если она ещё в очереди — убрать её оттуда."""
+        worker.cancel()
+        if self.pool.tryTake(worker):
+            self._workers.discard(worker)
+
+    def shutdown(self, timeout_ms: int = 5000) -> bool:
+        """
+        Остановить очередь при выходе: убрать ждущие задачи, отменить запущенные
+        и подождать их не дольше timeout_ms. Возвращает True, если все завершились.
+        """
+        self.pool.clear()
+        for worker in list(self._workers):
+            worker.cancel()
+        done = self.pool.waitForDone(timeout_ms)
+        if not done:
+            log.warning("Не все загрузки остановились за %d мс", timeout_ms)
+        return done
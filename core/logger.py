@@ -4,7 +4,10 @@ logger.py — Логирование приложения.
 """
 
 import os
+import queue
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
 from core.config import (
     LOG_FILENAME, LOG_LEVEL, LOG_FORMAT, LOG_DATE_FORMAT,
@@ -14,14 +17,51 @@ from core.config import (
 LOG_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 LOG_FILE = os.path.join(LOG_DIR, LOG_FILENAME)
 
-# Ссылка на файловый хэндлер (нужна для переключения)
+# Единый форматтер для всех хэндлеров
+_FORMATTER = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+
+# Ссылка на файловый хэндлер (нужна для переключения).
+# Запись в файл идёт в фоновом потоке QueueListener, логгер лишь кладёт записи в очередь.
 _file_handler: logging.FileHandler | None = None
+_queue_handler: QueueHandler | None = None
+_listener: QueueListener | None = None
 
 
-def setup_logger(log_to_file: bool = DEFAULT_LOG_TO_FILE) -> logging.Logger:
-    """Настраивает и возвращает логгер приложения."""
-    global _file_handler
+def _start_file_logging(logger: logging.Logger):
+    """Подключить запись в файл через очередь и фоновый поток."""
+    global _file_handler, _queue_handler, _listener
+
+    _file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+    _file_handler.setLevel(getattr(logging, LOG_LEVEL, logging.DEBUG))
+    _file_handler.setFormatter(_FORMATTER)
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
+    _listener = QueueListener(log_queue, _file_handler, respect_handler_level=True)
+    _listener.start()
+    logger.addHandler(_queue_handler)
+
+
+def _stop_file_logging(logger: logging.Logger):
+    """Отключить запись в файл, дописав всё, что осталось в очереди."""
+    global _file_handler, _queue_handler, _listener
+
+    if _queue_handler is not None:
+        logger.removeHandler(_queue_handler)
+    if _listener is not None:
+        _listener.stop()
+    if _file_handler is not None:
+        _file_handler.close()
+    _file_handler = None
+    _queue_handler = None
+    _listener = None
 
+
+def setup_logger(log_to_file: bool = DEFAULT_LOG_TO_FILE) -> logging.Logger:
+    """
+    Настраивает и возвращает логгер приложения.
+    Вызывается из main.py после загрузки настроек — до этого в файл ничего не пишется.
+    """
     logger = logging.getLogger(LOG_LOGGER_NAME)
 
     if logger.handlers:
@@ -29,14 +69,9 @@ def setup_logger(log_to_file: bool = DEFAULT_LOG_TO_FILE) -> logging.Logger:
 
     logger.setLevel(getattr(logging, LOG_LEVEL, logging.DEBUG))
 
-    formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
-
     # Файловый хэндлер (если включён)
     if log_to_file:
-        _file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
-        _file_handler.setLevel(getattr(logging, LOG_LEVEL, logging.DEBUG))
-        _file_handler.setFormatter(formatter)
-        logger.addHandler(_file_handler)
+        _start_file_logging(logger)
 
     # Стартовая запись
     logger.info("=" * 60)
@@ -51,38 +86,20 @@ def set_log_to_file(enabled: bool):
     Включить/выключить запись лога в файл в runtime.
     Вызывается из настроек при переключении чекбокса.
     """
-    global _file_handler
     logger = logging.getLogger(LOG_LOGGER_NAME)
-    formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
 
     if enabled and _file_handler is None:
         # Включаем файловый лог
-        _file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
-        _file_handler.setLevel(getattr(logging, LOG_LEVEL, logging.DEBUG))
-        _file_handler.setFormatter(formatter)
-        logger.addHandler(_file_handler)
+        _start_file_logging(logger)
         logger.info("Логирование в файл включено")
     elif not enabled and _file_handler is not None:
         # Выключаем файловый лог
         logger.info("Логирование в файл выключено")
-        logger.removeHandler(_file_handler)
-        _file_handler.close()
-        _file_handler = None
-
+        _stop_file_logging(logger)
 
-def _read_log_to_file_setting() -> bool:
-    """Читает настройку log_to_file из JSON-файла (без импорта settings_dialog)."""
-    import json
-    from core.config import SETTINGS_FILE
-    try:
-        if os.path.exists(SETTINGS_FILE):
-            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return data.get("log_to_file", DEFAULT_LOG_TO_FILE)
-    except Exception:
-        pass
-    return DEFAULT_LOG_TO_FILE
 
+# Глобальный логгер (файловый хэндлер подключает setup_logger)
+log = logging.getLogger(LOG_LOGGER_NAME)
 
-# Глобальный логгер
-log = setup_logger(log_to_file=_read_log_to_file_setting())
+# При выходе дописываем в файл записи, оставшиеся в очереди
+atexit.register(lambda: _stop_file_logging(log))
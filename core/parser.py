@@ -3,12 +3,14 @@ parser.py — Извлечение метаданных YouTube-видео че
 """
 
 import re
+from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Optional
 
 import yt_dlp
 
 
-# Паттерны YouTube URL
+# Паттерны YouTube URL (оставлены для совместимости, проверка идёт через _YT_RE)
 YOUTUBE_URL_PATTERNS = [
     r'(https?://)?(www\.)?youtube\.com/watch\?v=[\w-]+',
     r'(https?://)?(www\.)?youtube\.com/shorts/[\w-]+',
@@ -16,13 +18,25 @@ YOUTUBE_URL_PATTERNS = [
     r'(https?://)?(www\.)?youtube\.com/embed/[\w-]+',
 ]
 
+# Все паттерны одним регулярным выражением (компилируется один раз при импорте)
+_YT_RE = re.compile(
+    r'(?:https?://)?'
+    r'(?:(?:www\.)?youtube\.com/(?:watch\?v=|shorts/|embed/)|youtu\.be/)'
+    r'[\w-]+'
+)
+
+# Служебные форматы, которые не показываем пользователю
+_SKIP_EXT = frozenset({"mhtml"})
+_STORYBOARD = "storyboard"
+
 
 def is_youtube_url(url: str) -> bool:
     """Проверяет, является ли строка валидным YouTube URL."""
-    for pattern in YOUTUBE_URL_PATTERNS:
-        if re.match(pattern, url.strip()):
-            return True
-    return False
+    s = url.strip()
+    # Дешёвый отсев произвольного текста из буфера обмена до запуска регэкспа
+    if "youtu" not in s:
+        return False
+    return _YT_RE.match(s) is not None
 
 
 def normalize_url(url: str) -> str:
@@ -33,24 +47,29 @@ def normalize_url(url: str) -> str:
     return url
 
 
+@dataclass(slots=True)
 class VideoFormat:
     """Информация о доступном формате видео."""
 
-    def __init__(self, format_id: str, ext: str, resolution: str,
-                 filesize: Optional[int], vcodec: str, acodec: str,
-                 fps: Optional[int], tbr: Optional[float], format_note: str,
-                 height: Optional[int] = None, width: Optional[int] = None):
-        self.format_id = format_id
-        self.ext = ext
-        self.resolution = resolution
-        self.filesize = filesize
-        self.vcodec = vcodec
-        self.acodec = acodec
-        self.fps = fps
-        self.tbr = tbr
-        self.format_note = format_note
-        self.height = height or 0
-        self.width = width or 0
+    format_id: str
+    ext: str
+    resolution: str
+    filesize: Optional[int]
+    vcodec: str
+    acodec: str
+    fps: Optional[int]
+    tbr: Optional[float]
+    format_note: str
+    height: Optional[int] = None
+    width: Optional[int] = None
+    protocol: str = ""           # https / m3u8_native / ... (пусто — неизвестно)
+    # Вычисляется один раз в __post_init__
+    display_name: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self):
+        self.height = self.height or 0
+        self.width = self.width or 0
+        self.display_name = self._compute_display_name()
 
     @property
     def has_video(self) -> bool:
@@ -66,8 +85,7 @@ class VideoFormat:
             return round(self.filesize / (1024 * 1024), 1)
         return None
 
-    @property
-    def display_name(self) -> str:
+    def _compute_display_name(self) -> str:
         """Человекочитаемое название формата."""
         parts = []
         if self.height > 0:
@@ -87,18 +105,17 @@ class VideoFormat:
         return f"<VideoFormat {self.format_id}: {self.display_name}>"
 
 
+@dataclass(slots=True)
 class VideoInfo:
     """Метаданные YouTube-видео."""
 
-    def __init__(self, url: str, title: str, duration: int, channel: str,
-                 thumbnail: str, video_id: str, formats: list[VideoFormat]):
-        self.url = url
-        self.title = title
-        self.duration = duration
-        self.channel = channel
-        self.thumbnail = thumbnail
-        self.video_id = video_id
-        self.formats = formats
+    url: str
+    title: str
+    duration: int
+    channel: str
+    thumbnail: str
+    video_id: str
+    formats: list[VideoFormat]
 
     @property
     def duration_str(self) -> str:
@@ -138,9 +155,9 @@ def parse_video(url: str) -> VideoInfo:
         format_note = f.get("format_note", "")
 
         # Пропускаем storyboard / манифесты
-        if "storyboard" in format_note.lower():
+        if format_note and _STORYBOARD in format_note.casefold():
             continue
-        if ext in ("mhtml",):
+        if ext in _SKIP_EXT:
             continue
 
         fmt = VideoFormat(
@@ -155,11 +172,12 @@ def parse_video(url: str) -> VideoInfo:
             format_note=format_note,
             height=f.get("height"),      # Реальная высота из yt-dlp
             width=f.get("width"),        # Реальная ширина из yt-dlp
+            protocol=f.get("protocol", "") or "",
         )
         formats.append(fmt)
 
     # Сортировка: по высоте по убыванию
-    formats.sort(key=lambda x: -(x.height or 0))
+    formats.sort(key=attrgetter("height"), reverse=True)
 
     return VideoInfo(
         url=url,
@@ -172,28 +190,45 @@ def parse_video(url: str) -> VideoInfo:
     )
 
 
+def _format_preference(f: VideoFormat) -> tuple:
+    """
+    Ключ выбора среди форматов одной высоты: прямая загрузка по HTTPS
+    (не HLS/DASH-манифест), затем mp4, затем больший битрейт.
+    """
+    direct = not f.protocol or f.protocol in ("http", "https")
+    return (direct, f.ext == "mp4", f.tbr or 0.0)
+
+
 def get_best_formats(video_info: VideoInfo) -> list[dict]:
     """
     Возвращает список «удобных» форматов для UI:
     - bestvideo+bestaudio для каждого уникального разрешения (по высоте)
     - best audio only
     """
-    seen_heights = set()
+    best_by_height: dict[int, VideoFormat] = {}
     result = []
+    best_audio = None
+    best_tbr = -1.0
 
-    # Видео-форматы
+    # Один проход: лучший видео-формат для каждой высоты и лучший аудио-формат
     for f in video_info.formats:
         if not f.has_video:
+            if f.has_audio:
+                tbr = f.tbr if f.tbr is not None else 0.0
+                if tbr > best_tbr:
+                    best_tbr = tbr
+                    best_audio = f
             continue
         if f.height < 240:
             continue
 
-        # Группируем по стандартным разрешениям
-        h = f.height
-        if h in seen_heights:
-            continue
-        seen_heights.add(h)
+        # Группируем по высоте, оставляя предпочтительный вариант
+        current = best_by_height.get(f.height)
+        if current is None or _format_preference(f) > _format_preference(current):
+            best_by_height[f.height] = f
 
+    # formats отсортированы по убыванию высоты — порядок ключей тот же
+    for h, f in best_by_height.items():
         result.append({
             "label": f"{h}p • MP4",
             "format_id": f.format_id,
@@ -205,9 +240,7 @@ def get_best_formats(video_info: VideoInfo) -> list[dict]:
         })
 
     # Аудио-only (лучший)
-    audio_formats = [f for f in video_info.formats if not f.has_video and f.has_audio]
-    if audio_formats:
-        best_audio = max(audio_formats, key=lambda x: x.tbr or 0)
+    if best_audio is not None:
         result.append({
             "label": "MP3 • Audio Only",
             "format_id": best_audio.format_id,
@@ -0,0 +1,57 @@
+"""
+workers.py — Фоновые задачи для QThreadPool: парсинг метаданных видео
+и проверка FFmpeg. Сами core.parser и core.converter не зависят от Qt.
+"""
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from core.converter import check_ffmpeg
+from core.logger import log
+from core.parser import parse_video
+
+
+class ParseSignals(QObject):
+    """Сигналы ParseWorker (QRunnable сам не может их объявлять)."""
+    finished = pyqtSignal(object)  # VideoInfo
+    error = pyqtSignal(str)
+
+
+class ParseWorker(QRunnable):
+    """Задача парсинга метаданных видео для QThreadPool (не блокирует UI)."""
+
+    def __init__(self, url: str, parent=None):
+        super().__init__()
+        # Жизнью задачи управляет Python: вызывающий держит ссылку до сигнала
+        self.setAutoDelete(False)
+        self.signals = ParseSignals(parent)
+        self.finished = self.signals.finished
+        self.error = self.signals.error
+        self.url = url
+
+    def run(self):
+        try:
+            log.info("Парсинг видео: %s", self.url)
+            info = parse_video(self.url)
+            log.info("Парсинг OK: %s | %s", info.title, info.duration_str)
+            self.finished.emit(info)
+        except Exception as e:
+            log.error("Ошибка парсинга: %s", e, exc_info=True)
+            self.error.emit(str(e))
+
+
+class FfmpegCheckSignals(QObject):
+    """Сигналы FfmpegCheckWorker."""
+    finished = pyqtSignal(bool)
+
+
+class FfmpegCheckWorker(QRunnable):
+    """Фоновая проверка FFmpeg, чтобы поиск в PATH не блокировал GUI-поток."""
+
+    def __init__(self, parent=None):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = FfmpegCheckSignals(parent)
+        self.finished = self.signals.finished
+
+    def run(self):
+        self.finished.emit(check_ffmpeg())
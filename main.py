@@ -9,10 +9,11 @@ import os
 
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QFont
-from PyQt6.QtCore import Qt
 
 from core.config import APP_NAME, ORG_NAME, APP_FONT, APP_FONT_SIZE
+from core.logger import setup_logger
 from ui.main_window import MainWindow
+from ui.settings_dialog import load_settings
 from ui.styles import GLOBAL_STYLESHEET
 
 
@@ -24,6 +25,10 @@ def main():
     app.setApplicationName(APP_NAME)
     app.setOrganizationName(ORG_NAME)
 
+    # Логгер запускается после загрузки настроек (и переноса старого JSON),
+    # чтобы запись в файл включалась по актуальному значению
+    setup_logger(log_to_file=load_settings()["log_to_file"])
+
     # Устанавливаем шрифт
     font = QFont(APP_FONT, APP_FONT_SIZE)
     app.setFont(font)
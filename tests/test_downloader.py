@@ -0,0 +1,83 @@
+"""
+Тесты для вспомогательных функций форматирования в модуле загрузки.
+"""
+
+from core.downloader import DownloadWorker, ProgressTick
+
+
+def test_format_bytes_units():
+    """Проверка выбора единиц измерения на границах."""
+    assert DownloadWorker._format_bytes(0) == "0 B"
+    assert DownloadWorker._format_bytes(1023) == "1023 B"
+    assert DownloadWorker._format_bytes(1024) == "1.0 KB"
+    assert DownloadWorker._format_bytes(1024 ** 2) == "1.0 MB"
+    assert DownloadWorker._format_bytes(3 * 1024 ** 3) == "3.00 GB"
+
+
+def test_format_speed_units():
+    """Скорость выше мегабайта в секунду остаётся в MB/s."""
+    assert DownloadWorker._format_speed(512) == "512 B/s"
+    assert DownloadWorker._format_speed(1536) == "1.5 KB/s"
+    assert DownloadWorker._format_speed(2 * 1024 ** 3) == "2048.0 MB/s"
+
+
+def test_format_eta():
+    """Проверка форматирования оставшегося времени."""
+    assert DownloadWorker._format_eta(-1) == "N/A"
+    assert DownloadWorker._format_eta(65) == "1:05"
+    assert DownloadWorker._format_eta(3725) == "1:02:05"
+
+
+def test_progress_hook_throttled():
+    """Частые колбэки yt-dlp не должны порождать сигнал на каждый тик."""
+    worker = DownloadWorker("https://youtu.be/dQw4w9WgXcQ", {"type": "video"}, ".")
+    ticks = []
+    worker.progress.connect(ticks.append)
+
+    tick = {"status": "downloading", "downloaded_bytes": 10, "total_bytes": 100}
+    worker._progress_hook(tick)
+    worker._progress_hook(tick)
+    assert len(ticks) == 1
+
+    # 100% отправляется всегда, даже внутри интервала
+    worker._progress_hook({**tick, "downloaded_bytes": 100})
+    assert len(ticks) == 2
+    assert isinstance(ticks[-1], ProgressTick)
+    assert ticks[-1].percent == 100.0
+
+
+def test_format_table_matches_builder():
+    """Предсобранная таблица форматов совпадает с динамической сборкой."""
+    from core.downloader import _FORMAT_TABLE, _build_format
+
+    for (height, has_ffmpeg), format_str in _FORMAT_TABLE.items():
+        assert format_str == _build_format(height, has_ffmpeg)
+    assert "bestvideo[height<=1080]" in _FORMAT_TABLE[(1080, True)]
+    assert "bestvideo" not in _FORMAT_TABLE[(1080, False)]
+
+
+def test_manager_shutdown_cancels_queue():
+    """shutdown() убирает ждущие задачи и не ждёт дольше таймаута отмены."""
+    import time
+    from core.downloader import DownloadManager
+
+    started = []
+
+    class SlowWorker(DownloadWorker):
+        def _run_download(self):
+            started.append(self)
+            deadline = time.monotonic() + 10
+            while not self._cancelled and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+    manager = DownloadManager(max_concurrent=1)
+    workers = [SlowWorker("https://youtu.be/x", {"type": "video"}, ".") for _ in range(3)]
+    for worker in workers:
+        manager.start(worker)
+    while not started:
+        time.sleep(0.01)
+
+    t0 = time.monotonic()
+    assert manager.shutdown(timeout_ms=2000) is True
+    assert time.monotonic() - t0 < 2
+    assert started == workers[:1]
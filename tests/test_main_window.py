@@ -0,0 +1,89 @@
+"""
+Тесты главного окна (без дисплея, платформа offscreen).
+"""
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from unittest import mock
+
+import pytest
+from PyQt6.QtCore import Qt, QSettings, QThreadPool
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QApplication
+
+from core.parser import VideoFormat, VideoInfo
+from ui import settings_dialog
+from ui.settings_dialog import SettingsStore
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(qapp, tmp_path, monkeypatch):
+    """Главное окно с настройками во временной папке и готовой информацией о видео."""
+    from ui import main_window
+    from ui.main_window import MainWindow
+
+    monkeypatch.setattr(main_window, "THUMB_CACHE_DIR", str(tmp_path / "thumbs"))
+    monkeypatch.setattr(settings_dialog, "SETTINGS_FILE", str(tmp_path / "settings.json"))
+    store = SettingsStore(QSettings(str(tmp_path / "settings.ini"), QSettings.Format.IniFormat))
+    monkeypatch.setattr(settings_dialog, "_store", store)
+
+    w = MainWindow()
+    w.settings["output_dir"] = str(tmp_path)
+    w.video_info = VideoInfo(
+        "https://youtu.be/x", "Видео", 60, "Канал", "", "x",
+        [VideoFormat("22", "mp4", "1280x720", None, "avc1", "mp4a", 30, 1500.0, "", height=720)],
+    )
+    w.best_formats = [{"type": "video", "format_id": "22", "height": 720, "label": "720p"}]
+    w.show()
+    qapp.processEvents()
+    yield w
+    w.close()
+
+
+def test_reused_card_is_visible(window, qapp):
+    """Карточка, убранная из списка и взятая из пула, снова видна и с новым превью."""
+    thumb = QPixmap(80, 45)
+    thumb.fill(Qt.GlobalColor.red)
+
+    with mock.patch.object(window.download_manager, "start"):
+        window._start_download(window.best_formats[0])
+        qapp.processEvents()
+        card = window.downloads_layout.itemAt(0).widget()
+        worker = window.active_workers[0]
+
+        assert card.thumb_label.pixmap().isNull()  # Превью ещё не было
+
+        card.set_error("ошибка")
+        window._cancel_download(worker, card)  # ✕ на завершённой карточке — убрать
+        assert window._card_pool == [card]
+        assert window.empty_label.isVisibleTo(window)
+
+        window.thumbnail_card_pixmap = thumb
+        window._start_download(window.best_formats[0])
+        qapp.processEvents()
+
+    assert window.downloads_layout.itemAt(0).widget() is card
+    assert not card.isHidden()
+    assert card.isVisibleTo(window)
+    assert not window.empty_label.isVisibleTo(window)
+    assert card.thumb_label.pixmap().cacheKey() == thumb.cacheKey()
+
+
+def test_repeated_ffmpeg_check_keeps_pending_workers(window, qapp):
+    """Повторная проверка FFmpeg не теряет предыдущую задачу до её сигнала."""
+    with mock.patch("core.workers.check_ffmpeg", return_value=False):
+        window._check_ffmpeg_async()
+        window._check_ffmpeg_async()
+        assert len(window._ffmpeg_workers) >= 1
+        QThreadPool.globalInstance().waitForDone()
+        qapp.processEvents()
+
+    assert window._ffmpeg_workers == {}
+    assert "⚠️" in window.ffmpeg_label.text()
@@ -41,3 +41,86 @@ def test_normalize_url():
     
     # Лишние пробелы -> убираются
     assert normalize_url("   https://youtu.be/123   ") == "https://youtu.be/123"
+
+
+def test_is_youtube_url_matches_legacy_patterns():
+    """Единый регэксп должен давать тот же результат, что и старый список паттернов."""
+    import re
+    from core.parser import YOUTUBE_URL_PATTERNS
+
+    urls = [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "youtu.be/dQw4w9WgXcQ",
+        "www.youtube.com/shorts/ABCDEFG123",
+        "https://youtube.com/embed/dQw4w9WgXcQ",
+        "https://youtube.com/playlist?list=PL123",
+        "https://vimeo.com/12345",
+    ]
+    for url in urls:
+        legacy = any(re.match(p, url) for p in YOUTUBE_URL_PATTERNS)
+        assert is_youtube_url(url) is legacy, f"Расхождение для URL: {url}"
+
+
+def test_video_format_fields():
+    """Проверка нормализации высоты и человекочитаемого названия формата."""
+    from core.parser import VideoFormat
+
+    fmt = VideoFormat(
+        format_id="137", ext="mp4", resolution="1920x1080",
+        filesize=50 * 1024 * 1024, vcodec="avc1", acodec="none",
+        fps=60, tbr=None, format_note="1080p60", height=1080,
+    )
+    assert fmt.has_video and not fmt.has_audio
+    assert fmt.width == 0
+    assert fmt.display_name == "1080p • 60fps • MP4 • ~50.0 MB"
+    assert not hasattr(fmt, "__dict__")
+
+    audio = VideoFormat("140", "m4a", "audio only", None, "none", "mp4a", None, 129.5, "medium")
+    assert audio.height == 0
+    assert audio.display_name == "M4A • ~130kbps"
+
+
+def test_get_best_formats():
+    """
+    Уникальные разрешения по убыванию (для каждой — прямой mp4 с наибольшим битрейтом)
+    + один лучший аудио-формат в конце.
+    """
+    from core.parser import VideoFormat, VideoInfo, get_best_formats
+
+    formats = [
+        VideoFormat("270", "mp4", "1920x1080", None, "avc1", "none", 30, 5000.0, "", height=1080,
+                    protocol="m3u8_native"),
+        VideoFormat("299", "mp4", "1920x1080", None, "avc1", "none", 60, 6000.0, "", height=1080,
+                    protocol="http_dash_segments"),
+        VideoFormat("248", "webm", "1920x1080", None, "vp9", "none", 30, 3000.0, "", height=1080),
+        VideoFormat("136", "mp4", "1920x1080", None, "avc1", "none", 30, 2000.0, "", height=1080,
+                    protocol="https"),
+        VideoFormat("137", "mp4", "1920x1080", None, "avc1", "none", 30, 4000.0, "", height=1080,
+                    protocol="https"),
+        VideoFormat("22", "mp4", "1280x720", None, "avc1", "mp4a", 30, 1500.0, "", height=720),
+        VideoFormat("160", "mp4", "256x144", None, "avc1", "none", 30, 100.0, "", height=144),
+        VideoFormat("139", "m4a", "audio only", None, "none", "mp4a", None, 48.0, ""),
+        VideoFormat("140", "m4a", "audio only", None, "none", "mp4a", None, 129.0, ""),
+        VideoFormat("599", "m4a", "audio only", None, "none", "mp4a", None, None, ""),
+    ]
+    info = VideoInfo("https://youtu.be/x", "t", 0, "c", "", "x", formats)
+
+    best = get_best_formats(info)
+    assert [f["format_id"] for f in best] == ["137", "22", "140"]
+    assert best[1]["has_audio"] is True
+    assert best[-1]["type"] == "audio"
+
+
+def test_parser_has_no_qt_or_logger_imports():
+    """core.parser — чистые функции: импорт не тянет Qt и не запускает логгер."""
+    import os
+    import subprocess
+    import sys
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = (
+        "import sys, core.parser; "
+        "assert 'core.logger' not in sys.modules; "
+        "assert 'PyQt6.QtCore' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
@@ -0,0 +1,81 @@
+"""
+Тесты загрузки и сохранения настроек.
+"""
+
+import json
+
+import pytest
+from PyQt6.QtCore import QSettings
+
+from ui import settings_dialog
+from ui.settings_dialog import DEFAULT_SETTINGS, SettingsStore
+
+
+@pytest.fixture
+def ini_path(tmp_path, monkeypatch):
+    """INI-файл QSettings и путь к старому JSON во временной папке."""
+    monkeypatch.setattr(settings_dialog, "SETTINGS_FILE", str(tmp_path / "settings.json"))
+    return str(tmp_path / "settings.ini")
+
+
+def make_store(ini_path: str) -> SettingsStore:
+    return SettingsStore(QSettings(ini_path, QSettings.Format.IniFormat))
+
+
+def test_load_defaults(ini_path):
+    """Без сохранённых значений возвращаются настройки по умолчанию."""
+    assert make_store(ini_path).load() == DEFAULT_SETTINGS
+
+
+def test_save_and_load_roundtrip(ini_path):
+    """Сохранённые настройки читаются обратно с правильными типами."""
+    store = make_store(ini_path)
+    store.save({"max_concurrent": 5, "smart_paste": True})
+    del store
+
+    settings = make_store(ini_path).load()
+    assert settings["max_concurrent"] == 5
+    assert settings["smart_paste"] is True
+    assert settings["default_format"] == DEFAULT_SETTINGS["default_format"]
+
+
+def test_migrate_from_json(ini_path, tmp_path):
+    """Старый JSON переносится в QSettings один раз и переименовывается."""
+    json_path = tmp_path / "settings.json"
+    json_path.write_text(json.dumps({"default_format": "720p", "log_to_file": False}), encoding="utf-8")
+
+    settings = make_store(ini_path).load()
+    assert settings["default_format"] == "720p"
+    assert settings["log_to_file"] is False
+    assert not json_path.exists()
+    assert (tmp_path / "settings.json.bak").exists()
+
+
+def test_save_stores_only_diff(ini_path):
+    """Значения по умолчанию не записываются, возврат к умолчанию удаляет ключ."""
+    store = make_store(ini_path)
+    store.save({**DEFAULT_SETTINGS, "max_concurrent": 5})
+    assert store._qs.allKeys() == ["max_concurrent"]
+
+    store.save(dict(DEFAULT_SETTINGS))
+    assert store._qs.allKeys() == []
+
+
+def test_migration_runs_once_when_rename_fails(ini_path, tmp_path, monkeypatch):
+    """Непереименованный JSON не перетирает настройки, изменённые после переноса."""
+    json_path = tmp_path / "settings.json"
+    json_path.write_text(json.dumps({"max_concurrent": 4}), encoding="utf-8")
+
+    def fail_replace(src, dst):
+        raise PermissionError("busy")
+
+    monkeypatch.setattr(settings_dialog.os, "replace", fail_replace)
+
+    store = make_store(ini_path)
+    assert store.load()["max_concurrent"] == 4
+    store.save({"max_concurrent": 2})
+    store._qs.sync()
+    del store
+
+    assert json_path.exists()
+    assert make_store(ini_path).load()["max_concurrent"] == 2
@@ -6,26 +6,104 @@ import os
 import subprocess
 import sys
 
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QPixmap, QIcon
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QPixmap
 from PyQt6.QtWidgets import (
     QFrame, QHBoxLayout, QVBoxLayout, QLabel,
     QProgressBar, QPushButton, QWidget, QSizePolicy,
 )
 
+from core.downloader import ProgressTick
 from ui.styles import (
-    SUCCESS_GREEN, ERROR_RED, WARNING_YELLOW,
-    TEXT_SECONDARY, TEXT_MUTED, BG_CARD, BORDER_COLOR,
+    SUCCESS_GREEN, ERROR_RED, TEXT_SECONDARY, BORDER_COLOR,
 )
 
+# Стили карточки собираются один раз при импорте, а не для каждой карточки
+_THUMB_CSS = """
+    background-color: #252525;
+    border-radius: 6px;
+"""
+
+_THUMB_EMOJI_CSS = """
+    background-color: #252525;
+    border-radius: 6px;
+    font-size: 20px;
+"""
+
+_TITLE_CSS = "font-weight: bold; font-size: 13px;"
+
+_CANCEL_BTN_CSS = f"""
+    QPushButton {{
+        background-color: transparent;
+        border: 1px solid {BORDER_COLOR};
+        border-radius: 6px;
+        font-size: 14px;
+        color: {TEXT_SECONDARY};
+    }}
+    QPushButton:hover {{
+        background-color: {ERROR_RED};
+        color: white;
+        border-color: {ERROR_RED};
+    }}
+"""
+
+_OPEN_BTN_CSS = f"""
+    QPushButton {{
+        background-color: transparent;
+        border: 1px solid {BORDER_COLOR};
+        border-radius: 6px;
+        font-size: 14px;
+        color: {TEXT_SECONDARY};
+    }}
+    QPushButton:hover {{
+        background-color: {SUCCESS_GREEN};
+        color: white;
+        border-color: {SUCCESS_GREEN};
+    }}
+"""
+
+
+class ElidingLabel(QLabel):
+    """QLabel, который обрезает текст многоточием под свою текущую ширину."""
+
+    def __init__(self, text: str = "", parent=None):
+        super().__init__(parent)
+        self._full = ""
+        # Ширину диктует layout, а не длина текста — иначе лейбл не сможет сузиться
+        self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
+        self.setText(text)
+
+    def setText(self, text: str):
+        self._full = text
+        self._elide()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._elide()
+
+    def _elide(self):
+        super().setText(self.fontMetrics().elidedText(
+            self._full, Qt.TextElideMode.ElideRight, self.width()
+        ))
+
 
 class DownloadCard(QFrame):
     """Карточка одной загрузки с превью, прогрессом и кнопками управления."""
 
     def __init__(self, title: str, thumbnail_pixmap: QPixmap = None, parent=None):
+        """thumbnail_pixmap — превью, заранее масштабированное до 80×45."""
         super().__init__(parent)
         self.setObjectName("downloadCard")
         self.filepath = ""
+        self.is_done = False  # Загрузка завершена, отменена или упала
+
+        # Прогресс применяется не чаще раза за кадр (~60 Гц), берётся последний тик
+        self._pending_tick: ProgressTick = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(16)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
         self._setup_ui(title, thumbnail_pixmap)
 
     def _setup_ui(self, title: str, thumbnail_pixmap: QPixmap):
@@ -36,25 +114,8 @@ class DownloadCard(QFrame):
         # Превью (маленькое)
         self.thumb_label = QLabel()
         self.thumb_label.setFixedSize(80, 45)
-        self.thumb_label.setStyleSheet(f"""
-            background-color: #252525;
-            border-radius: 6px;
-        """)
         self.thumb_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        if thumbnail_pixmap:
-            scaled = thumbnail_pixmap.scaled(
-                80, 45,
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            self.thumb_label.setPixmap(scaled)
-        else:
-            self.thumb_label.setText("🎬")
-            self.thumb_label.setStyleSheet(f"""
-                background-color: #252525;
-                border-radius: 6px;
-                font-size: 20px;
-            """)
+        self._set_thumbnail(thumbnail_pixmap)
         layout.addWidget(self.thumb_label)
 
         # Центральная часть: название + прогресс + статус
@@ -62,14 +123,9 @@ class DownloadCard(QFrame):
         center.setSpacing(4)
 
         # Название
-        self.title_label = QLabel(title)
-        self.title_label.setStyleSheet("font-weight: bold; font-size: 13px;")
+        self.title_label = ElidingLabel(title)
+        self.title_label.setStyleSheet(_TITLE_CSS)
         self.title_label.setMaximumWidth(400)
-        self.title_label.setWordWrap(False)
-        elided = self.title_label.fontMetrics().elidedText(
-            title, Qt.TextElideMode.ElideRight, 400
-        )
-        self.title_label.setText(elided)
         center.addWidget(self.title_label)
 
         # Прогресс-бар
@@ -83,7 +139,7 @@ class DownloadCard(QFrame):
 
         # Статус: скорость / ETA
         self.status_label = QLabel("Ожидание...")
-        self.status_label.setStyleSheet(f"font-size: 11px; color: {TEXT_SECONDARY};")
+        self.status_label.setObjectName("cardStatusLabel")
         center.addWidget(self.status_label)
 
         layout.addLayout(center, 1)
@@ -98,20 +154,7 @@ class DownloadCard(QFrame):
         self.cancel_btn.setObjectName("cancelBtn")
         self.cancel_btn.setToolTip("Отменить загрузку")
         self.cancel_btn.setFixedSize(32, 32)
-        self.cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 6px;
-                font-size: 14px;
-                color: {TEXT_SECONDARY};
-            }}
-            QPushButton:hover {{
-                background-color: {ERROR_RED};
-                color: white;
-                border-color: {ERROR_RED};
-            }}
-        """)
+        self.cancel_btn.setStyleSheet(_CANCEL_BTN_CSS)
         buttons.addWidget(self.cancel_btn)
 
         # Кнопка открыть файл (скрыта до завершения)
@@ -119,33 +162,68 @@ class DownloadCard(QFrame):
         self.open_btn.setObjectName("folderBtn")
         self.open_btn.setToolTip("Открыть папку")
         self.open_btn.setFixedSize(32, 32)
-        self.open_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 6px;
-                font-size: 14px;
-                color: {TEXT_SECONDARY};
-            }}
-            QPushButton:hover {{
-                background-color: {SUCCESS_GREEN};
-                color: white;
-                border-color: {SUCCESS_GREEN};
-            }}
-        """)
+        self.open_btn.setStyleSheet(_OPEN_BTN_CSS)
         self.open_btn.setVisible(False)
         self.open_btn.clicked.connect(self._open_folder)
         buttons.addWidget(self.open_btn)
 
         layout.addLayout(buttons)
 
-    def update_progress(self, data: dict):
-        """Обновить прогресс загрузки."""
-        percent = data.get("percent", 0)
-        speed = data.get("speed", "")
-        eta = data.get("eta", "")
-        downloaded = data.get("downloaded", "")
-        total = data.get("total", "")
+    def _set_thumbnail(self, thumbnail_pixmap: QPixmap):
+        """Поставить превью 80×45 или заглушку, если превью нет."""
+        self.thumb_label.clear()
+        if thumbnail_pixmap:
+            # Превью приходит уже масштабированным до 80×45
+            self.thumb_label.setPixmap(thumbnail_pixmap)
+            self.thumb_label.setStyleSheet(_THUMB_CSS)
+        else:
+            self.thumb_label.setText("🎬")
+            self.thumb_label.setStyleSheet(_THUMB_EMOJI_CSS)
+
+    def reset_to_initial_state(self, title: str, thumbnail_pixmap: QPixmap = None):
+        """
+        Вернуть карточку в исходное состояние для новой загрузки
+        (карточки переиспользуются через пул в MainWindow).
+        """
+        self._progress_timer.stop()
+        self._pending_tick = None
+        self.filepath = ""
+        self.is_done = False
+
+        self._set_thumbnail(thumbnail_pixmap)
+        self.title_label.setText(title)
+        self.progress_bar.setValue(0)
+        self._set_style_state(self.progress_bar, "state", "")
+        self.status_label.setText("Ожидание...")
+        self._set_style_state(self.status_label, "kind", "")
+
+        # Старая кнопка отмены была привязана к предыдущему worker'у
+        try:
+            self.cancel_btn.clicked.disconnect()
+        except TypeError:
+            pass
+        self.cancel_btn.setToolTip("Отменить загрузку")
+        self.cancel_btn.setVisible(True)
+        self.open_btn.setVisible(False)
+
+    def _mark_done(self):
+        """Загрузка закончилась: кнопка ✕ теперь убирает карточку из списка."""
+        self.is_done = True
+        self.cancel_btn.setToolTip("Убрать из списка")
+
+    def update_progress(self, tick: ProgressTick):
+        """Обновить прогресс загрузки (применяется по таймеру, см. _flush_progress)."""
+        self._pending_tick = tick
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        """Применить последний полученный тик прогресса."""
+        self._progress_timer.stop()
+        tick, self._pending_tick = self._pending_tick, None
+        if tick is None:
+            return
+        percent, speed, eta, downloaded, total = tick
 
         self.progress_bar.setValue(int(percent))
 
@@ -164,50 +242,59 @@ class DownloadCard(QFrame):
 
     def set_status(self, text: str):
         """Установить текстовый статус."""
+        self._flush_progress()
         self.status_label.setText(text)
 
-    def set_finished(self, filepath: str):
-        """Отметить загрузку как завершённую."""
+    def set_finished(self, filepath: str, size_bytes: int = None):
+        """
+        Отметить загрузку как завершённую.
+        size_bytes передаёт worker; если его нет — размер читается с диска.
+        """
+        self._flush_progress()
         self.filepath = filepath
         self.progress_bar.setValue(100)
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar::chunk {{
-                background: {SUCCESS_GREEN};
-                border-radius: 6px;
-            }}
-        """)
-
-        filename = os.path.basename(filepath)
+        self._set_style_state(self.progress_bar, "state", "ok")
+
         size_mb = ""
-        try:
-            size = os.path.getsize(filepath)
-            size_mb = f" • {size / (1024*1024):.1f} MB"
-        except OSError:
-            pass
+        if size_bytes is None:
+            try:
+                size_bytes = os.path.getsize(filepath)
+            except OSError:
+                pass
+        if size_bytes is not None:
+            size_mb = f" • {size_bytes / (1024*1024):.1f} MB"
 
         self.status_label.setText(f"✅ Готово{size_mb}")
-        self.status_label.setStyleSheet(f"font-size: 11px; color: {SUCCESS_GREEN};")
-        self.cancel_btn.setVisible(False)
+        self._set_style_state(self.status_label, "kind", "ok")
+        self._mark_done()
         self.open_btn.setVisible(True)
 
     def set_error(self, message: str):
         """Отметить загрузку как ошибочную."""
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar::chunk {{
-                background: {ERROR_RED};
-                border-radius: 6px;
-            }}
-        """)
+        self._flush_progress()
+        self._set_style_state(self.progress_bar, "state", "error")
         short_msg = message[:80] + "..." if len(message) > 80 else message
         self.status_label.setText(f"❌ {short_msg}")
-        self.status_label.setStyleSheet(f"font-size: 11px; color: {ERROR_RED};")
-        self.cancel_btn.setVisible(False)
+        self._set_style_state(self.status_label, "kind", "error")
+        self._mark_done()
 
     def set_cancelled(self):
         """Отметить загрузку как отменённую."""
+        self._flush_progress()
         self.status_label.setText("⏹ Отменено")
-        self.status_label.setStyleSheet(f"font-size: 11px; color: {TEXT_MUTED};")
-        self.cancel_btn.setVisible(False)
+        self._set_style_state(self.status_label, "kind", "muted")
+        self._mark_done()
+
+    @staticmethod
+    def _set_style_state(widget: QWidget, name: str, value: str):
+        """
+        Переключить динамическое свойство, по которому GLOBAL_STYLESHEET
+        выбирает оформление, и переприменить стиль только к этому виджету.
+        """
+        widget.setProperty(name, value)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
 
     def _open_folder(self):
         """Открыть папку с файлом в проводнике."""
@@ -3,70 +3,102 @@ main_window.py — Главное окно YouTube Downloader.
 """
 
 import os
-import io
-import urllib.request
+import math
 
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QSize
-from PyQt6.QtGui import QPixmap, QIcon, QClipboard, QFont
+from PyQt6.QtCore import Qt, QThreadPool, QTimer, QSize, QUrl, QBuffer
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader
+from PyQt6.QtNetwork import (
+    QNetworkAccessManager, QNetworkDiskCache, QNetworkReply, QNetworkRequest,
+)
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QPushButton, QComboBox, QFrame, QScrollArea,
-    QApplication, QMessageBox, QSizePolicy, QSpacerItem,
+    QApplication, QSpacerItem,
 )
 
-from core.parser import parse_video, get_best_formats, is_youtube_url, VideoInfo
-from core.downloader import DownloadWorker
-from core.converter import check_ffmpeg
+from core.parser import get_best_formats, is_youtube_url, VideoInfo
+from core.workers import FfmpegCheckWorker, ParseWorker
+from core.downloader import DownloadWorker, DownloadManager
+from core.converter import clear_ffmpeg_cache
+from core.config import DEFAULT_MAX_CONCURRENT, THUMB_CACHE_DIR
 from core.logger import log
 from ui.download_card import DownloadCard
 from ui.settings_dialog import SettingsDialog, load_settings, save_settings
 from ui.styles import (
-    BG_DARK, BG_CARD, BG_INPUT, BORDER_COLOR, TEXT_SECONDARY,
-    TEXT_MUTED, YOUTUBE_RED, ACCENT, ERROR_RED, SUCCESS_GREEN,
+    BG_CARD, BG_INPUT, BORDER_COLOR, TEXT_SECONDARY,
+    TEXT_MUTED, YOUTUBE_RED, ERROR_RED, SUCCESS_GREEN,
 )
 
+# Стили главного окна собираются один раз при импорте
+_HEADER_ICON_CSS = f"""
+    font-size: 28px;
+    color: {YOUTUBE_RED};
+    background: transparent;
+"""
 
-class FetchWorker(QThread):
-    """Рабочий поток для парсинга метаданных видео."""
-    finished = pyqtSignal(object)  # VideoInfo
-    error = pyqtSignal(str)
+_FFMPEG_BADGE_CSS = """
+    font-size: 11px;
+    color: {color};
+    padding: 4px 10px;
+    border: 1px solid {color};
+    border-radius: 10px;
+"""
+_FFMPEG_OK_CSS = _FFMPEG_BADGE_CSS.format(color=SUCCESS_GREEN)
+_FFMPEG_MISSING_CSS = _FFMPEG_BADGE_CSS.format(color=ERROR_RED)
+_FFMPEG_PENDING_CSS = _FFMPEG_BADGE_CSS.format(color=TEXT_MUTED)
+
+_SETTINGS_BTN_CSS = f"""
+    QPushButton {{
+        background-color: transparent;
+        border: 1px solid {BORDER_COLOR};
+        border-radius: 10px;
+        font-size: 18px;
+        color: {TEXT_SECONDARY};
+    }}
+    QPushButton:hover {{
+        background-color: {BG_CARD};
+        border-color: {TEXT_MUTED};
+    }}
+"""
 
-    def __init__(self, url: str, parent=None):
-        super().__init__(parent)
-        self.url = url
+_THUMB_CSS = f"""
+    background-color: {BG_INPUT};
+    border-radius: 10px;
+"""
 
-    def run(self):
-        try:
-            log.info(f"Парсинг видео: {self.url}")
-            info = parse_video(self.url)
-            log.info(f"Парсинг OK: {info.title} | {info.duration_str}")
-            self.finished.emit(info)
-        except Exception as e:
-            import traceback
-            log.error(f"Ошибка парсинга: {e}\n{traceback.format_exc()}")
-            self.error.emit(str(e))
+_THUMB_PLACEHOLDER_CSS = f"""
+    background-color: {BG_INPUT};
+    border-radius: 10px;
+    font-size: 36px;
+"""
 
+_FORMAT_LABEL_CSS = f"color: {TEXT_SECONDARY}; font-size: 13px;"
 
-class ThumbnailWorker(QThread):
-    """Рабочий поток для загрузки превью из сети."""
-    finished = pyqtSignal(QPixmap)
+_EMPTY_LABEL_CSS = f"""
+    color: {TEXT_MUTED};
+    font-size: 14px;
+    padding: 40px;
+"""
 
-    def __init__(self, url: str, parent=None):
-        super().__init__(parent)
-        self.url = url
+_STATUS_BAR_CSS = f"font-size: 11px; color: {TEXT_MUTED};"
 
-    def run(self):
-        try:
-            req = urllib.request.Request(self.url, headers={
-                "User-Agent": "Mozilla/5.0"
-            })
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                data = resp.read()
-            pixmap = QPixmap()
-            pixmap.loadFromData(data)
-            self.finished.emit(pixmap)
-        except Exception:
-            self.finished.emit(QPixmap())
+# Сколько убранных карточек загрузок держать для переиспользования
+_CARD_POOL_SIZE = 8
+
+
+def _read_preview(reader: QImageReader) -> QImage:
+    """
+    Декодировать превью сразу в размере, покрывающем 240×135
+    (как KeepAspectRatioByExpanding) — JPEG-декодер не распаковывает лишние пиксели.
+    """
+    size = reader.size()
+    if size.width() > 0 and size.height() > 0:
+        scale = max(240 / size.width(), 135 / size.height())
+        reader.setScaledSize(QSize(
+            math.ceil(size.width() * scale),
+            math.ceil(size.height() * scale),
+        ))
+    return reader.read()
 
 
 class MainWindow(QMainWindow):
@@ -82,11 +114,46 @@ class MainWindow(QMainWindow):
         self.video_info: VideoInfo = None
         self.best_formats: list[dict] = []
         self.active_workers: list[DownloadWorker] = []
+        self.download_manager = DownloadManager(
+            self.settings.get("max_concurrent", DEFAULT_MAX_CONCURRENT)
+        )
         self.thumbnail_pixmap: QPixmap = None
+        self.thumbnail_card_pixmap: QPixmap = None  # Превью 80×45 для карточек загрузок
         self._last_clipboard = ""
-
+        self._clipboard_connected = False
+        self._checking_clipboard = False
+        self._fetch_request_id = 0
+        self._parse_workers: dict[int, ParseWorker] = {}
+        self._ffmpeg_check_id = 0
+        self._ffmpeg_workers: dict[int, FfmpegCheckWorker] = {}
+        self._last_formats_sig: tuple = None
+        # Убранные из списка карточки переиспользуются для следующих загрузок
+        self._card_pool: list[DownloadCard] = []
+        self._settings_dlg: SettingsDialog = None
+
+        # Новые карточки вставляются в список пачкой на следующем витке event loop
+        self._pending_cards: list[DownloadCard] = []
+        self._cards_timer = QTimer(self)
+        self._cards_timer.setSingleShot(True)
+        self._cards_timer.setInterval(0)
+        self._cards_timer.timeout.connect(self._flush_pending_cards)
+
+        self._setup_network()
         self._setup_ui()
         self._setup_smart_paste()
+        self._check_ffmpeg_async()
+
+    def _setup_network(self):
+        """Общий сетевой менеджер с дисковым кэшем для загрузки превью."""
+        self._nam = QNetworkAccessManager(self)
+        cache = QNetworkDiskCache(self._nam)
+        cache.setCacheDirectory(os.path.join(THUMB_CACHE_DIR, "http"))
+        # Ограничен по размеру: старые записи вытесняются самим кэшем
+        cache.setMaximumCacheSize(50 * 1024 * 1024)
+        self._nam.setCache(cache)
+        # Декодированные превью в памяти, ключ — ID видео
+        QPixmapCache.setCacheLimit(20_000)  # КБ
+        self._thumb_reply: QNetworkReply = None
 
     def _setup_ui(self):
         """Построить интерфейс."""
@@ -100,11 +167,7 @@ class MainWindow(QMainWindow):
         header_layout = QHBoxLayout()
 
         header_icon = QLabel("▶")
-        header_icon.setStyleSheet(f"""
-            font-size: 28px;
-            color: {YOUTUBE_RED};
-            background: transparent;
-        """)
+        header_icon.setStyleSheet(_HEADER_ICON_CSS)
         header_layout.addWidget(header_icon)
 
         header_label = QLabel("YouTube Downloader")
@@ -113,39 +176,17 @@ class MainWindow(QMainWindow):
 
         header_layout.addStretch()
 
-        # Статус FFmpeg
-        ffmpeg_ok = check_ffmpeg()
-        ffmpeg_label = QLabel(f"{'✅' if ffmpeg_ok else '⚠️'} FFmpeg")
-        ffmpeg_label.setStyleSheet(f"""
-            font-size: 11px;
-            color: {SUCCESS_GREEN if ffmpeg_ok else ERROR_RED};
-            padding: 4px 10px;
-            border: 1px solid {SUCCESS_GREEN if ffmpeg_ok else ERROR_RED};
-            border-radius: 10px;
-        """)
-        ffmpeg_label.setToolTip(
-            "FFmpeg найден" if ffmpeg_ok else
-            "FFmpeg не найден! Установите FFmpeg для поддержки 1080p+ и MP3"
-        )
-        header_layout.addWidget(ffmpeg_label)
+        # Статус FFmpeg (проверяется в фоне, см. _check_ffmpeg_async)
+        self.ffmpeg_label = QLabel("⏳ FFmpeg")
+        self.ffmpeg_label.setStyleSheet(_FFMPEG_PENDING_CSS)
+        self.ffmpeg_label.setToolTip("Поиск FFmpeg...")
+        header_layout.addWidget(self.ffmpeg_label)
 
         # Кнопка настроек
         settings_btn = QPushButton("⚙")
         settings_btn.setToolTip("Настройки")
         settings_btn.setFixedSize(40, 40)
-        settings_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 10px;
-                font-size: 18px;
-                color: {TEXT_SECONDARY};
-            }}
-            QPushButton:hover {{
-                background-color: {BG_CARD};
-                border-color: {TEXT_MUTED};
-            }}
-        """)
+        settings_btn.setStyleSheet(_SETTINGS_BTN_CSS)
         settings_btn.clicked.connect(self._open_settings)
         header_layout.addWidget(settings_btn)
 
@@ -162,6 +203,7 @@ class MainWindow(QMainWindow):
 
         self.fetch_btn = QPushButton("🔍  Найти")
         self.fetch_btn.setObjectName("fetchBtn")
+        self.fetch_btn.setProperty("accent", True)
         self.fetch_btn.clicked.connect(self._fetch_info)
         url_layout.addWidget(self.fetch_btn)
 
@@ -185,17 +227,9 @@ class MainWindow(QMainWindow):
         # Превью
         self.thumbnail_label = QLabel()
         self.thumbnail_label.setFixedSize(240, 135)
-        self.thumbnail_label.setStyleSheet(f"""
-            background-color: {BG_INPUT};
-            border-radius: 10px;
-        """)
         self.thumbnail_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.thumbnail_label.setText("📷")
-        self.thumbnail_label.setStyleSheet(f"""
-            background-color: {BG_INPUT};
-            border-radius: 10px;
-            font-size: 36px;
-        """)
+        self.thumbnail_label.setStyleSheet(_THUMB_PLACEHOLDER_CSS)
         info_layout.addWidget(self.thumbnail_label)
 
         # Правая часть: мета + кнопки
@@ -219,7 +253,7 @@ class MainWindow(QMainWindow):
         format_layout.setSpacing(8)
 
         format_label = QLabel("Формат:")
-        format_label.setStyleSheet(f"color: {TEXT_SECONDARY}; font-size: 13px;")
+        format_label.setStyleSheet(_FORMAT_LABEL_CSS)
         format_layout.addWidget(format_label)
 
         self.format_combo = QComboBox()
@@ -234,11 +268,13 @@ class MainWindow(QMainWindow):
 
         self.download_btn = QPushButton("📥  Скачать видео")
         self.download_btn.setObjectName("downloadBtn")
+        self.download_btn.setProperty("accent", True)
         self.download_btn.clicked.connect(self._download_video)
         dl_layout.addWidget(self.download_btn)
 
         self.mp3_btn = QPushButton("🎵  Скачать MP3")
         self.mp3_btn.setObjectName("mp3Btn")
+        self.mp3_btn.setProperty("accent", True)
         self.mp3_btn.clicked.connect(self._download_mp3)
         dl_layout.addWidget(self.mp3_btn)
 
@@ -266,11 +302,7 @@ class MainWindow(QMainWindow):
         # Плейсхолдер
         self.empty_label = QLabel("Нет активных загрузок")
         self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.empty_label.setStyleSheet(f"""
-            color: {TEXT_MUTED};
-            font-size: 14px;
-            padding: 40px;
-        """)
+        self.empty_label.setStyleSheet(_EMPTY_LABEL_CSS)
         self.downloads_layout.addWidget(self.empty_label)
 
         scroll.setWidget(self.downloads_container)
@@ -281,43 +313,75 @@ class MainWindow(QMainWindow):
 
         smart_paste_status = "Вкл" if self.settings.get("smart_paste", True) else "Выкл"
         self.smart_paste_label = QLabel(f"📋 Smart Paste: {smart_paste_status}")
-        self.smart_paste_label.setStyleSheet(f"font-size: 11px; color: {TEXT_MUTED};")
+        self.smart_paste_label.setStyleSheet(_STATUS_BAR_CSS)
         status_layout.addWidget(self.smart_paste_label)
 
         status_layout.addStretch()
 
         save_dir = self.settings.get("output_dir", "")
         self.dir_label = QLabel(f"📁 {save_dir}")
-        self.dir_label.setStyleSheet(f"font-size: 11px; color: {TEXT_MUTED};")
+        self.dir_label.setStyleSheet(_STATUS_BAR_CSS)
         status_layout.addWidget(self.dir_label)
 
         main_layout.addLayout(status_layout)
 
+    def _check_ffmpeg_async(self):
+        """Запустить проверку FFmpeg в пуле потоков; результат обновит бейдж."""
+        # Предыдущая проверка может ещё идти: её задача остаётся в словаре
+        # до сигнала, а устаревший результат отбрасывается по номеру
+        self._ffmpeg_check_id += 1
+        check_id = self._ffmpeg_check_id
+        worker = FfmpegCheckWorker()
+        worker.finished.connect(lambda ok, cid=check_id: self._on_ffmpeg_checked(ok, cid))
+        self._ffmpeg_workers[check_id] = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_ffmpeg_checked(self, ffmpeg_ok: bool, check_id: int):
+        """Обновить бейдж FFmpeg по результату проверки."""
+        self._ffmpeg_workers.pop(check_id, None)
+        if check_id != self._ffmpeg_check_id:
+            return  # Устаревший результат
+        self.ffmpeg_label.setText(f"{'✅' if ffmpeg_ok else '⚠️'} FFmpeg")
+        self.ffmpeg_label.setStyleSheet(_FFMPEG_OK_CSS if ffmpeg_ok else _FFMPEG_MISSING_CSS)
+        self.ffmpeg_label.setToolTip(
+            "FFmpeg найден" if ffmpeg_ok else
+            "FFmpeg не найден! Установите FFmpeg для поддержки 1080p+ и MP3"
+        )
+
     def _setup_smart_paste(self):
-        """Настроить мониторинг буфера обмена (Smart Paste)."""
-        if not self.settings.get("smart_paste", True):
-            return
+        """Настроить мониторинг буфера обмена (Smart Paste) по сигналу dataChanged."""
+        clipboard = QApplication.clipboard()
+        enabled = self.settings.get("smart_paste", True)
 
-        self.clipboard_timer = QTimer(self)
-        self.clipboard_timer.timeout.connect(self._check_clipboard)
-        self.clipboard_timer.start(1000)  # Проверяем каждую секунду
+        if enabled and not self._clipboard_connected:
+            clipboard.dataChanged.connect(self._check_clipboard)
+            self._clipboard_connected = True
+            # Ссылка могла быть скопирована ещё до включения
+            self._check_clipboard()
+        elif not enabled and self._clipboard_connected:
+            clipboard.dataChanged.disconnect(self._check_clipboard)
+            self._clipboard_connected = False
 
     def _check_clipboard(self):
         """Проверить буфер обмена на YouTube-ссылку."""
-        if not self.settings.get("smart_paste", True):
+        if not self.settings.get("smart_paste", True) or self._checking_clipboard:
             return
 
-        clipboard = QApplication.clipboard()
-        text = clipboard.text().strip()
-
-        if text and text != self._last_clipboard and is_youtube_url(text):
-            self._last_clipboard = text
-            # Вставляем в поле только если оно пустое или содержит старую ссылку
-            current = self.url_input.text().strip()
-            if not current or is_youtube_url(current):
-                self.url_input.setText(text)
-                # Автоматически загружаем инфо
-                self._fetch_info()
+        self._checking_clipboard = True
+        try:
+            clipboard = QApplication.clipboard()
+            text = clipboard.text().strip()
+
+            if text and text != self._last_clipboard and is_youtube_url(text):
+                self._last_clipboard = text
+                # Вставляем в поле только если оно пустое или содержит старую ссылку
+                current = self.url_input.text().strip()
+                if not current or is_youtube_url(current):
+                    self.url_input.setText(text)
+                    # Автоматически загружаем инфо
+                    self._fetch_info()
+        finally:
+            self._checking_clipboard = False
 
     def _fetch_info(self):
         """Загрузить метаданные видео по URL."""
@@ -336,14 +400,21 @@ class MainWindow(QMainWindow):
         self.info_frame.setVisible(False)
         self._hide_error()
 
-        # Запускаем парсинг в отдельном потоке
-        self.fetch_worker = FetchWorker(url)
-        self.fetch_worker.finished.connect(self._on_info_fetched)
-        self.fetch_worker.error.connect(self._on_info_error)
-        self.fetch_worker.start()
-
-    def _on_info_fetched(self, info: VideoInfo):
+        # Запускаем парсинг в общем пуле потоков.
+        # Номер запроса позволяет отбросить ответ, если уже запрошено другое видео.
+        self._fetch_request_id += 1
+        request_id = self._fetch_request_id
+        worker = ParseWorker(url)
+        worker.finished.connect(lambda info, rid=request_id: self._on_info_fetched(info, rid))
+        worker.error.connect(lambda msg, rid=request_id: self._on_info_error(msg, rid))
+        self._parse_workers[request_id] = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_info_fetched(self, info: VideoInfo, request_id: int):
         """Обработка успешного парсинга метаданных."""
+        self._parse_workers.pop(request_id, None)
+        if request_id != self._fetch_request_id:
+            return  # Устаревший ответ
         self.video_info = info
         self.best_formats = get_best_formats(info)
 
@@ -351,14 +422,19 @@ class MainWindow(QMainWindow):
         self.title_label.setText(info.title)
         self.meta_label.setText(f"👤 {info.channel}  •  ⏱ {info.duration_str}")
 
-        # Заполняем комбобокс форматов
-        self.format_combo.clear()
-        for fmt in self.best_formats:
-            if fmt["type"] == "video":
-                label = fmt["label"]
-                if fmt.get("filesize_mb"):
-                    label += f"  (~{fmt['filesize_mb']} MB)"
-                self.format_combo.addItem(label)
+        # Заполняем комбобокс форматов (если набор форматов не изменился — не пересобираем)
+        formats_sig = (info.url, tuple(
+            (f["type"], f.get("format_id"), f.get("label")) for f in self.best_formats
+        ))
+        if formats_sig != self._last_formats_sig:
+            self._last_formats_sig = formats_sig
+            self.format_combo.clear()
+            for fmt in self.best_formats:
+                if fmt["type"] == "video":
+                    label = fmt["label"]
+                    if fmt.get("filesize_mb"):
+                        label += f"  (~{fmt['filesize_mb']} MB)"
+                    self.format_combo.addItem(label)
 
         # Показываем панель
         self.info_frame.setVisible(True)
@@ -369,28 +445,84 @@ class MainWindow(QMainWindow):
 
         # Загружаем превью
         if info.thumbnail:
-            self.thumb_worker = ThumbnailWorker(info.thumbnail)
-            self.thumb_worker.finished.connect(self._on_thumbnail_loaded)
-            self.thumb_worker.start()
+            self._load_thumbnail(info.video_id, info.thumbnail)
+
+    def _load_thumbnail(self, video_id: str, url: str):
+        """
+        Загрузить превью: сначала из памяти (QPixmapCache), иначе запросом
+        через QNetworkDiskCache (PreferCache — без сети, если ответ уже на диске).
+        """
+        if self._thumb_reply is not None:
+            self._thumb_reply.abort()
+
+        if video_id:
+            key = f"thumb:{video_id}"
+            pixmap = QPixmapCache.find(key)
+            if pixmap is not None:
+                self._on_thumbnail_loaded(pixmap)
+                return
+
+        request = QNetworkRequest(QUrl(url))
+        request.setRawHeader(b"User-Agent", b"Mozilla/5.0")
+        request.setAttribute(
+            QNetworkRequest.Attribute.CacheLoadControlAttribute,
+            QNetworkRequest.CacheLoadControl.PreferCache,
+        )
+        # Все превью идут через один менеджер: соединение с i.ytimg.com
+        # переиспользуется (keep-alive / мультиплексирование HTTP/2)
+        request.setAttribute(QNetworkRequest.Attribute.Http2AllowedAttribute, True)
+        request.setTransferTimeout(10_000)
+
+        reply = self._nam.get(request)
+        reply.finished.connect(lambda r=reply, v=video_id: self._on_thumbnail_reply(r, v))
+        self._thumb_reply = reply
+
+    def _on_thumbnail_reply(self, reply: QNetworkReply, video_id: str):
+        """Декодировать загруженное превью (ответ приходит в GUI-потоке)."""
+        reply.deleteLater()
+        if reply is not self._thumb_reply:
+            return  # Устаревший ответ: уже запрошено превью другого видео
+        self._thumb_reply = None
+        if reply.error() != QNetworkReply.NetworkError.NoError:
+            return
+
+        raw = reply.readAll()
+        buffer = QBuffer(raw)
+        buffer.open(QBuffer.OpenModeFlag.ReadOnly)
+        image = _read_preview(QImageReader(buffer))
+        if image.isNull():
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        if video_id:
+            QPixmapCache.insert(f"thumb:{video_id}", pixmap)
+        self._on_thumbnail_loaded(pixmap)
 
     def _on_thumbnail_loaded(self, pixmap: QPixmap):
         """Обработка загруженного превью."""
         if pixmap.isNull():
             return
         self.thumbnail_pixmap = pixmap
+        # Масштабируем для карточек один раз, а не в каждой новой карточке.
+        # Для иконки 80×45 сглаживание незаметно — используем быстрый режим.
+        self.thumbnail_card_pixmap = pixmap.scaled(
+            80, 45,
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+            Qt.TransformationMode.FastTransformation,
+        )
         scaled = pixmap.scaled(
             240, 135,
             Qt.AspectRatioMode.KeepAspectRatioByExpanding,
             Qt.TransformationMode.SmoothTransformation,
         )
         self.thumbnail_label.setPixmap(scaled)
-        self.thumbnail_label.setStyleSheet(f"""
-            background-color: {BG_INPUT};
-            border-radius: 10px;
-        """)
+        self.thumbnail_label.setStyleSheet(_THUMB_CSS)
 
-    def _on_info_error(self, message: str):
+    def _on_info_error(self, message: str, request_id: int):
         """Обработка ошибки парсинга."""
+        self._parse_workers.pop(request_id, None)
+        if request_id != self._fetch_request_id:
+            return  # Устаревший ответ
         self._show_error(f"Ошибка: {message}")
         self.fetch_btn.setEnabled(True)
         self.fetch_btn.setText("🔍  Найти")
@@ -427,9 +559,15 @@ class MainWindow(QMainWindow):
         # Скрываем placeholder
         self.empty_label.setVisible(False)
 
-        # Создаём карточку
-        card = DownloadCard(self.video_info.title, self.thumbnail_pixmap)
-        self.downloads_layout.insertWidget(0, card)  # Новые — сверху
+        # Берём карточку из пула или создаём новую
+        if self._card_pool:
+            card = self._card_pool.pop()
+            card.reset_to_initial_state(self.video_info.title, self.thumbnail_card_pixmap)
+        else:
+            card = DownloadCard(self.video_info.title, self.thumbnail_card_pixmap)
+        self._pending_cards.append(card)
+        if not self._cards_timer.isActive():
+            self._cards_timer.start()
 
         # Создаём worker
         output_dir = self.settings.get("output_dir", os.path.expanduser("~/Downloads"))
@@ -444,21 +582,34 @@ class MainWindow(QMainWindow):
         # Подключаем сигналы
         worker.progress.connect(card.update_progress)
         worker.status_update.connect(card.set_status)
-        worker.finished.connect(lambda path, c=card: c.set_finished(path))
-        worker.finished.connect(lambda path, w=worker: self._on_worker_finished(w))
+        worker.finished.connect(lambda path, size, c=card: c.set_finished(path, size))
+        worker.finished.connect(lambda path, size, w=worker: self._on_worker_finished(w))
         worker.error.connect(lambda msg, c=card: c.set_error(msg))
         worker.error.connect(lambda msg, w=worker: self._on_worker_finished(w))
 
         # Кнопка отмены
         card.cancel_btn.clicked.connect(lambda _, w=worker, c=card: self._cancel_download(w, c))
 
-        # Сохраняем и запускаем
+        # Сохраняем и ставим в очередь (пул ограничивает число одновременных загрузок)
         self.active_workers.append(worker)
-        worker.start()
+        self.download_manager.start(worker)
+
+    def _flush_pending_cards(self):
+        """Вставить накопленные карточки за один пересчёт layout'а."""
+        self.downloads_container.setUpdatesEnabled(False)
+        for card in self._pending_cards:
+            self.downloads_layout.insertWidget(0, card)  # Новые — сверху
+            card.show()  # Карточка из пула была скрыта в _release_card
+        self._pending_cards.clear()
+        self.downloads_container.setUpdatesEnabled(True)
+        self.downloads_layout.activate()
 
     def _cancel_download(self, worker: DownloadWorker, card: DownloadCard):
-        """Отменить загрузку."""
-        worker.cancel()
+        """Отменить загрузку или, если она уже закончилась, убрать карточку."""
+        if card.is_done:
+            self._release_card(worker, card)
+            return
+        self.download_manager.cancel(worker)
         card.set_cancelled()
         self._on_worker_finished(worker)
 
@@ -467,12 +618,49 @@ class MainWindow(QMainWindow):
         if worker in self.active_workers:
             self.active_workers.remove(worker)
 
+    def _release_card(self, worker: DownloadWorker, card: DownloadCard):
+        """Убрать карточку из списка загрузок и вернуть её в пул."""
+        # Отменённый worker может ещё прислать сигнал — карточка к тому времени чужая
+        for signal in (worker.progress, worker.status_update, worker.finished, worker.error):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass
+
+        self.downloads_layout.removeWidget(card)
+        card.hide()
+        if len(self._card_pool) < _CARD_POOL_SIZE:
+            self._card_pool.append(card)
+        else:
+            card.deleteLater()
+
+        # В layout остался только placeholder
+        if self.downloads_layout.count() == 1 and not self._pending_cards:
+            self.empty_label.setVisible(True)
+
+    def closeEvent(self, event):
+        """При закрытии окна останавливаем загрузки, иначе процесс останется висеть."""
+        self.download_manager.shutdown()
+        super().closeEvent(event)
+
     def _open_settings(self):
         """Открыть диалог настроек."""
-        dialog = SettingsDialog(self.settings, self)
-        if dialog.exec():
-            self.settings = dialog.get_settings()
+        # Диалог строится при первом открытии и дальше переиспользуется
+        if self._settings_dlg is None:
+            self._settings_dlg = SettingsDialog(self.settings, self)
+        else:
+            self._settings_dlg.refresh(self.settings)
+        if self._settings_dlg.exec():
+            self.settings = self._settings_dlg.get_settings()
             save_settings(self.settings)
+            # FFmpeg мог быть установлен за время сессии — ищем заново при следующей загрузке
+            clear_ffmpeg_cache()
+            self._check_ffmpeg_async()
+            self.download_manager.set_max_concurrent(
+                self.settings.get("max_concurrent", DEFAULT_MAX_CONCURRENT)
+            )
+            # Подключаем/отключаем Smart Paste
+            self._setup_smart_paste()
             # Обновляем статус-бар
             smart_paste_status = "Вкл" if self.settings.get("smart_paste", True) else "Выкл"
             self.smart_paste_label.setText(f"📋 Smart Paste: {smart_paste_status}")
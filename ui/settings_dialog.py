@@ -4,54 +4,126 @@ settings_dialog.py — Диалог настроек приложения.
 
 import os
 import re
-import json
+from types import MappingProxyType
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QSettings, QTimer
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QPushButton, QComboBox, QCheckBox,
-    QFileDialog, QGroupBox, QSpacerItem,
+    QFileDialog, QFormLayout, QGroupBox, QSpacerItem,
     QSizePolicy,
 )
 
 from core.config import (
-    SETTINGS_FILE,
+    APP_NAME, ORG_NAME, SETTINGS_FILE,
     DEFAULT_OUTPUT_DIR, DEFAULT_FORMAT,
     DEFAULT_SMART_PASTE, DEFAULT_MAX_CONCURRENT,
-    DEFAULT_LOG_TO_FILE,
+    DEFAULT_LOG_TO_FILE, DEFAULT_USE_NATIVE_DIALOG,
 )
-from core.logger import set_log_to_file
+from core.logger import log, set_log_to_file
 
-DEFAULT_SETTINGS = {
+# Старый JSON читается только при переносе в QSettings; orjson — если установлен
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Отметка в QSettings о том, что старый JSON уже перенесён
+_MIGRATED_KEY = "migrated_from_json"
+
+# Только для чтения: значения по умолчанию не копируются и не могут быть испорчены
+DEFAULT_SETTINGS = MappingProxyType({
     "output_dir": DEFAULT_OUTPUT_DIR,
     "default_format": DEFAULT_FORMAT,
     "smart_paste": DEFAULT_SMART_PASTE,
     "max_concurrent": DEFAULT_MAX_CONCURRENT,
     "log_to_file": DEFAULT_LOG_TO_FILE,
-}
+    "use_native_dialog": DEFAULT_USE_NATIVE_DIALOG,
+})
+
+
+# Политики размеров для спейсера (не ищем enum'ы при каждом построении диалога)
+_SP_MIN = QSizePolicy.Policy.Minimum
+_SP_EXP = QSizePolicy.Policy.Expanding
+
+# Разрешение в подписи пункта качества: "1440p (2K)" → "1440p"
+_FMT_RE = re.compile(r"(\d+p)")
+
+_FORMAT_ITEMS = ["2160p (4K)", "1440p (2K)", "1080p", "720p", "480p", "360p"]
+# "1080p" → индекс пункта в комбобоксе качества
+_FORMAT_INDEX = {_FMT_RE.search(item).group(1): i for i, item in enumerate(_FORMAT_ITEMS)}
+
+
+class SettingsStore:
+    """
+    Хранилище настроек на QSettings (реестр / plist / INI — в зависимости от ОС).
+    QSettings держит значения в памяти и пишет на диск сам, по одному ключу.
+    """
+
+    def __init__(self, qsettings: QSettings = None):
+        self._qs = qsettings if qsettings is not None else QSettings(ORG_NAME, APP_NAME)
+        self._migrate_json()
+
+    def load(self) -> dict:
+        """Все настройки; отсутствующие ключи берутся из DEFAULT_SETTINGS."""
+        return {
+            key: self._qs.value(key, default, type=type(default))
+            for key, default in DEFAULT_SETTINGS.items()
+        }
+
+    def save(self, settings: dict):
+        """
+        Записать только изменившиеся ключи. Значения, совпадающие с умолчаниями,
+        не хранятся — при загрузке они и так берутся из DEFAULT_SETTINGS.
+        """
+        for key, default in DEFAULT_SETTINGS.items():
+            value = settings.get(key, default)
+            if value == default:
+                if self._qs.contains(key):
+                    self._qs.remove(key)
+            elif self._qs.value(key, default, type=type(default)) != value:
+                self._qs.setValue(key, value)
+
+    def _migrate_json(self):
+        """Однократный перенос настроек из старого JSON-файла (файл переименовывается в .bak)."""
+        try:
+            with open(SETTINGS_FILE, "rb") as f:
+                saved = _json_loads(f.read())
+        except (OSError, ValueError):
+            return  # Файла нет (обычный случай) или он не читается
+
+        # Если перенос уже был (файл не удалось переименовать), старые значения
+        # не должны перетирать то, что пользователь поменял после
+        if not self._qs.allKeys() and isinstance(saved, dict):
+            self.save({key: saved[key] for key in DEFAULT_SETTINGS if key in saved})
+            self._qs.setValue(_MIGRATED_KEY, True)
+            self._qs.sync()
+
+        try:
+            os.replace(SETTINGS_FILE, SETTINGS_FILE + ".bak")
+        except OSError as e:
+            log.warning("Не удалось переименовать старый файл настроек %s: %s", SETTINGS_FILE, e)
+
+
+_store: SettingsStore = None
+
+
+def _get_store() -> SettingsStore:
+    """Общее хранилище настроек (создаётся при первом обращении)."""
+    global _store
+    if _store is None:
+        _store = SettingsStore()
+    return _store
 
 
 def load_settings() -> dict:
-    """Загрузить настройки из файла."""
-    try:
-        if os.path.exists(SETTINGS_FILE):
-            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-                saved = json.load(f)
-            settings = DEFAULT_SETTINGS.copy()
-            settings.update(saved)
-            return settings
-    except Exception:
-        pass
-    return DEFAULT_SETTINGS.copy()
+    """Загрузить настройки."""
+    return _get_store().load()
 
 
 def save_settings(settings: dict):
-    """Сохранить настройки в файл."""
-    try:
-        with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2, ensure_ascii=False)
-    except Exception:
-        pass
+    """Сохранить настройки (пишутся только изменившиеся значения)."""
+    _get_store().save(settings)
 
 
 class SettingsDialog(QDialog):
@@ -59,11 +131,48 @@ class SettingsDialog(QDialog):
 
     def __init__(self, settings: dict, parent=None):
         super().__init__(parent)
-        self.settings = settings.copy()
         self.setWindowTitle("⚙  Настройки")
-        self.setFixedSize(580, 540)
+        self.setFixedSize(580, 600)
         self.setModal(True)
+        # Построение и заполнение — одним проходом, без промежуточных перерисовок
+        self.setUpdatesEnabled(False)
         self._setup_ui()
+        self.refresh(settings)
+        self.setUpdatesEnabled(True)
+
+    def refresh(self, settings: dict):
+        """
+        Заполнить поля значениями из settings.
+        Диалог создаётся один раз, при повторных открытиях обновляются только поля.
+        """
+        self.settings = settings.copy()
+        # Файловый лог переключаем при сохранении, только если галочка изменилась
+        self._initial_log_to_file = self.settings.get("log_to_file", DEFAULT_LOG_TO_FILE)
+
+        self.dir_input.setText(self.settings.get("output_dir", ""))
+
+        # Выбор пунктов программный — сигналы комбобоксов не нужны
+        self.format_combo.blockSignals(True)
+        self.concurrent_combo.blockSignals(True)
+
+        current_fmt = self.settings.get("default_format", DEFAULT_FORMAT)
+        self.format_combo.setCurrentIndex(
+            _FORMAT_INDEX.get(current_fmt, _FORMAT_INDEX.get(DEFAULT_FORMAT, 0))
+        )
+
+        current_max = str(self.settings.get("max_concurrent", DEFAULT_MAX_CONCURRENT))
+        idx = self.concurrent_combo.findText(current_max)
+        if idx >= 0:
+            self.concurrent_combo.setCurrentIndex(idx)
+
+        self.format_combo.blockSignals(False)
+        self.concurrent_combo.blockSignals(False)
+
+        self.smart_paste_cb.setChecked(self.settings.get("smart_paste", DEFAULT_SMART_PASTE))
+        self.log_to_file_cb.setChecked(self.settings.get("log_to_file", DEFAULT_LOG_TO_FILE))
+        self.native_dialog_cb.setChecked(
+            self.settings.get("use_native_dialog", DEFAULT_USE_NATIVE_DIALOG)
+        )
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -73,7 +182,6 @@ class SettingsDialog(QDialog):
         # === Заголовок ===
         header = QLabel("⚙  Настройки")
         header.setObjectName("headerLabel")
-        header.setStyleSheet("font-size: 20px; font-weight: bold;")
         layout.addWidget(header)
 
         # === Папка сохранения ===
@@ -81,7 +189,7 @@ class SettingsDialog(QDialog):
         dir_layout = QHBoxLayout(dir_group)
         dir_layout.setContentsMargins(12, 24, 12, 12)
 
-        self.dir_input = QLineEdit(self.settings.get("output_dir", ""))
+        self.dir_input = QLineEdit()
         self.dir_input.setPlaceholderText("Путь к папке сохранения...")
         dir_layout.addWidget(self.dir_input, 1)
 
@@ -93,38 +201,22 @@ class SettingsDialog(QDialog):
 
         # === Параметры по умолчанию ===
         quality_group = QGroupBox("🎬  Параметры по умолчанию")
-        quality_inner = QVBoxLayout(quality_group)
-        quality_inner.setContentsMargins(12, 24, 12, 12)
-        quality_inner.setSpacing(12)
-
-        # Качество
-        q_row = QHBoxLayout()
-        q_label = QLabel("Качество:")
-        q_label.setFixedWidth(120)
-        q_row.addWidget(q_label)
+        quality_form = QFormLayout(quality_group)
+        quality_form.setContentsMargins(12, 24, 12, 12)
+        quality_form.setVerticalSpacing(12)
+        quality_form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.AllNonFixedFieldsGrow)
+
         self.format_combo = QComboBox()
-        self.format_combo.addItems(["2160p (4K)", "1440p (2K)", "1080p", "720p", "480p", "360p"])
-        current_fmt = self.settings.get("default_format", DEFAULT_FORMAT)
-        for i in range(self.format_combo.count()):
-            if current_fmt in self.format_combo.itemText(i):
-                self.format_combo.setCurrentIndex(i)
-                break
-        q_row.addWidget(self.format_combo, 1)
-        quality_inner.addLayout(q_row)
-
-        # Макс загрузок
-        c_row = QHBoxLayout()
-        c_label = QLabel("Макс. загрузок:")
-        c_label.setFixedWidth(120)
-        c_row.addWidget(c_label)
+        self.format_combo.blockSignals(True)
+        self.format_combo.addItems(_FORMAT_ITEMS)
+        self.format_combo.blockSignals(False)
+        quality_form.addRow("Качество:", self.format_combo)
+
         self.concurrent_combo = QComboBox()
+        self.concurrent_combo.blockSignals(True)
         self.concurrent_combo.addItems(["1", "2", "3", "4", "5"])
-        current_max = str(self.settings.get("max_concurrent", DEFAULT_MAX_CONCURRENT))
-        idx = self.concurrent_combo.findText(current_max)
-        if idx >= 0:
-            self.concurrent_combo.setCurrentIndex(idx)
-        c_row.addWidget(self.concurrent_combo, 1)
-        quality_inner.addLayout(c_row)
+        self.concurrent_combo.blockSignals(False)
+        quality_form.addRow("Макс. загрузок:", self.concurrent_combo)
 
         layout.addWidget(quality_group)
 
@@ -135,17 +227,18 @@ class SettingsDialog(QDialog):
         features_layout.setSpacing(8)
 
         self.smart_paste_cb = QCheckBox("Smart Paste — автоподхват ссылки из буфера обмена")
-        self.smart_paste_cb.setChecked(self.settings.get("smart_paste", DEFAULT_SMART_PASTE))
         features_layout.addWidget(self.smart_paste_cb)
 
         self.log_to_file_cb = QCheckBox("📝  Записывать лог в файл (youtube_downloader.log)")
-        self.log_to_file_cb.setChecked(self.settings.get("log_to_file", DEFAULT_LOG_TO_FILE))
         features_layout.addWidget(self.log_to_file_cb)
 
+        self.native_dialog_cb = QCheckBox("📂  Системный диалог выбора папки")
+        features_layout.addWidget(self.native_dialog_cb)
+
         layout.addWidget(features_group)
 
         # === Спейсер ===
-        layout.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding))
+        layout.addSpacerItem(QSpacerItem(0, 0, _SP_MIN, _SP_EXP))
 
         # === Кнопки ===
         btn_layout = QHBoxLayout()
@@ -156,7 +249,7 @@ class SettingsDialog(QDialog):
         btn_layout.addWidget(cancel_btn)
 
         save_btn = QPushButton("💾  Сохранить")
-        save_btn.setObjectName("downloadBtn")
+        save_btn.setProperty("accent", True)
         save_btn.clicked.connect(self._save)
         btn_layout.addWidget(save_btn)
 
@@ -164,9 +257,18 @@ class SettingsDialog(QDialog):
 
     def _browse_dir(self):
         """Открыть диалог выбора папки."""
+        # Подсказки для диалога Qt (без иконок папок и разрешения симлинков);
+        # нативный диалог их в основном игнорирует
+        options = (
+            QFileDialog.Option.ShowDirsOnly
+            | QFileDialog.Option.DontResolveSymlinks
+            | QFileDialog.Option.DontUseCustomDirectoryIcons
+        )
+        if not self.native_dialog_cb.isChecked():
+            options |= QFileDialog.Option.DontUseNativeDialog
         folder = QFileDialog.getExistingDirectory(
             self, "Выберите папку для сохранения",
-            self.dir_input.text()
+            self.dir_input.text(), options
         )
         if folder:
             self.dir_input.setText(folder)
@@ -176,15 +278,18 @@ class SettingsDialog(QDialog):
         self.settings["output_dir"] = self.dir_input.text()
 
         fmt_text = self.format_combo.currentText()
-        match = re.search(r'(\d+p)', fmt_text)
+        match = _FMT_RE.search(fmt_text)
         self.settings["default_format"] = match.group(1) if match else DEFAULT_FORMAT
 
         self.settings["max_concurrent"] = int(self.concurrent_combo.currentText())
         self.settings["smart_paste"] = self.smart_paste_cb.isChecked()
         self.settings["log_to_file"] = self.log_to_file_cb.isChecked()
+        self.settings["use_native_dialog"] = self.native_dialog_cb.isChecked()
 
-        # Применяем переключение лога в runtime
-        set_log_to_file(self.settings["log_to_file"])
+        # Применяем переключение лога в runtime — уже после закрытия диалога
+        log_to_file = self.settings["log_to_file"]
+        if log_to_file != self._initial_log_to_file:
+            QTimer.singleShot(0, lambda v=log_to_file: set_log_to_file(v))
 
         save_settings(self.settings)
         self.accept()
@@ -31,7 +31,6 @@ GLOBAL_STYLESHEET = f"""
 
 QMainWindow, QDialog {{
     background-color: {BG_DARK};
-    color: {TEXT_PRIMARY};
 }}
 
 QWidget {{
@@ -44,7 +43,6 @@ QWidget {{
 
 QPushButton {{
     background-color: {BG_BUTTON};
-    color: {TEXT_PRIMARY};
     border: 1px solid {BORDER_COLOR};
     border-radius: 8px;
     padding: 10px 20px;
@@ -68,8 +66,8 @@ QPushButton:disabled {{
     border-color: {BG_INPUT};
 }}
 
-/* Акцентная кнопка (скачать) */
-QPushButton#downloadBtn, QPushButton#mp3Btn {{
+/* Акцентные кнопки (найти, скачать, сохранить) — динамическое свойство accent */
+QPushButton[accent="true"] {{
     background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
         stop:0 {YOUTUBE_RED}, stop:1 {ACCENT});
     border: none;
@@ -79,42 +77,26 @@ QPushButton#downloadBtn, QPushButton#mp3Btn {{
     border-radius: 10px;
 }}
 
-QPushButton#downloadBtn:hover, QPushButton#mp3Btn:hover {{
+QPushButton[accent="true"]:hover {{
     background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
         stop:0 {ACCENT}, stop:1 {ACCENT_HOVER});
 }}
 
-QPushButton#downloadBtn:pressed, QPushButton#mp3Btn:pressed {{
+QPushButton[accent="true"]:pressed {{
     background: {ACCENT_DARK};
 }}
 
-QPushButton#downloadBtn:disabled, QPushButton#mp3Btn:disabled {{
+QPushButton[accent="true"]:disabled {{
     background: {BG_BUTTON};
     color: {TEXT_MUTED};
 }}
 
-/* Кнопка поиска */
+/* Кнопка поиска — чуть уже, но не меньше 100px */
 QPushButton#fetchBtn {{
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 {YOUTUBE_RED}, stop:1 {ACCENT});
-    border: none;
-    color: white;
-    font-size: 14px;
     padding: 12px 24px;
-    border-radius: 10px;
     min-width: 100px;
 }}
 
-QPushButton#fetchBtn:hover {{
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 {ACCENT}, stop:1 {ACCENT_HOVER});
-}}
-
-QPushButton#fetchBtn:disabled {{
-    background: {BG_BUTTON};
-    color: {TEXT_MUTED};
-}}
-
 /* Маленькие кнопки управления */
 QPushButton#cancelBtn, QPushButton#openBtn, QPushButton#folderBtn {{
     padding: 6px 12px;
@@ -127,7 +109,6 @@ QPushButton#cancelBtn, QPushButton#openBtn, QPushButton#folderBtn {{
 
 QLineEdit {{
     background-color: {BG_INPUT};
-    color: {TEXT_PRIMARY};
     border: 2px solid {BORDER_COLOR};
     border-radius: 10px;
     padding: 12px 16px;
@@ -147,7 +128,6 @@ QLineEdit::placeholder {{
 
 QComboBox {{
     background-color: {BG_INPUT};
-    color: {TEXT_PRIMARY};
     border: 2px solid {BORDER_COLOR};
     border-radius: 8px;
     padding: 8px 12px;
@@ -178,7 +158,6 @@ QComboBox::down-arrow {{
 
 QComboBox QAbstractItemView {{
     background-color: {BG_CARD};
-    color: {TEXT_PRIMARY};
     border: 1px solid {BORDER_COLOR};
     border-radius: 6px;
     selection-background-color: {ACCENT};
@@ -193,7 +172,6 @@ QProgressBar {{
     border: none;
     border-radius: 9px;
     text-align: center;
-    color: {TEXT_PRIMARY};
     font-size: 11px;
     font-weight: bold;
     min-height: 18px;
@@ -206,6 +184,17 @@ QProgressBar::chunk {{
     border-radius: 9px;
 }}
 
+/* Состояния карточки загрузки (динамическое свойство state) */
+QProgressBar[state="ok"]::chunk {{
+    background: {SUCCESS_GREEN};
+    border-radius: 6px;
+}}
+
+QProgressBar[state="error"]::chunk {{
+    background: {ERROR_RED};
+    border-radius: 6px;
+}}
+
 /* ===== СКРОЛЛБАР ===== */
 
 QScrollArea {{
@@ -243,7 +232,6 @@ QScrollBar::sub-page:vertical {{
 /* ===== ЛЕЙБЛЫ ===== */
 
 QLabel {{
-    color: {TEXT_PRIMARY};
     background: transparent;
 }}
 
@@ -260,7 +248,10 @@ QLabel#subtitleLabel {{
 QLabel#headerLabel {{
     font-size: 22px;
     font-weight: bold;
-    color: {TEXT_PRIMARY};
+}}
+
+QDialog QLabel#headerLabel {{
+    font-size: 20px;
 }}
 
 QLabel#sectionLabel {{
@@ -280,6 +271,24 @@ QLabel#successLabel {{
     font-size: 12px;
 }}
 
+/* Статус карточки загрузки (динамическое свойство kind) */
+QLabel#cardStatusLabel {{
+    font-size: 11px;
+    color: {TEXT_SECONDARY};
+}}
+
+QLabel#cardStatusLabel[kind="ok"] {{
+    color: {SUCCESS_GREEN};
+}}
+
+QLabel#cardStatusLabel[kind="error"] {{
+    color: {ERROR_RED};
+}}
+
+QLabel#cardStatusLabel[kind="muted"] {{
+    color: {TEXT_MUTED};
+}}
+
 /* ===== ФРЕЙМЫ / КАРТОЧКИ ===== */
 
 QFrame#infoCard, QFrame#downloadCard {{
@@ -296,7 +305,6 @@ QFrame#infoCard:hover {{
 /* ===== ЧЕКБОКСЫ ===== */
 
 QCheckBox {{
-    color: {TEXT_PRIMARY};
     spacing: 8px;
 }}
 
@@ -321,7 +329,6 @@ QCheckBox::indicator:hover {{
 
 QToolTip {{
     background-color: {BG_CARD};
-    color: {TEXT_PRIMARY};
     border: 1px solid {BORDER_COLOR};
     border-radius: 6px;
     padding: 6px 10px;